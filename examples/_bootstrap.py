@@ -0,0 +1,14 @@
+"""
+Shared setup for the example scripts.
+
+Makes the in-tree package importable when it is not installed via pip
+(`pip install -e .` makes this a no-op).
+"""
+import os
+import sys
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SRC_DIR = os.path.join(PROJECT_ROOT, "src")
+
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
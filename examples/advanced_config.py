@@ -4,20 +4,17 @@ This script simulates a real-world workflow: Full assembly followed by an increm
 """
 import json
 import os
-import sys
-from pathlib import Path
 
-sys.path.append(str(Path(__file__).resolve().parents[1] / "src"))
+from _bootstrap import PROJECT_ROOT
 from code_assembler import assemble_from_config
 
 def run_advanced_demo():
-    root = Path(__file__).resolve().parents[1]
     config_path = "demo_config.json"
     output_md = "advanced_snapshot.md"
 
     # 1. Define a complex configuration
     config = {
-        "paths": [str(root / "src")],
+        "paths": [os.path.join(PROJECT_ROOT, "src")],
         "extensions": [".py", ".j2", "Dockerfile"],
         "output": output_md,
         "exclude_patterns": ["__pycache__", "tests"],
@@ -4,12 +4,9 @@ Interactive mode demonstration for Code Assembler Pro.
 This script shows how to launch the interactive wizard programmatically.
 """
 import sys
-from pathlib import Path
 
 # Setup path
-current_file = Path(__file__).resolve()
-project_root = current_file.parents[1]
-sys.path.append(str(project_root / "src"))
+import _bootstrap  # noqa: F401
 
 try:
     from code_assembler import run_interactive_mode
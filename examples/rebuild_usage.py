@@ -3,15 +3,13 @@ Rebuild Engine Demo (New in v4.4).
 Demonstrates how to reconstruct a project structure from a Markdown snapshot.
 """
 import os
-import sys
 from pathlib import Path
 
-sys.path.append(str(Path(__file__).resolve().parents[1] / "src"))
+from _bootstrap import PROJECT_ROOT
 from code_assembler.rebuilder import CodebaseRebuilder
 
 def run_rebuild_demo():
-    project_root = Path(__file__).resolve().parents[1]
-    os.chdir(project_root)
+    os.chdir(PROJECT_ROOT)
     # 1. We need a source Markdown file with metadata
     # (Run basic_usage.py first to generate 'simple_snapshot.md')
     md_input = "simple_snapshot.md"
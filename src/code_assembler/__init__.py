@@ -1,11 +1,9 @@
 """
 Code Assembler Pro - A tool for consolidating source code for LLM analysis.
 """
+import importlib
 
-from .config import AssemblerConfig
 from .constants import __version__
-from .core import assemble_codebase, assemble_from_config
-from .interactive import run_interactive_mode
 
 __all__ = [
     "assemble_codebase",
@@ -14,3 +12,22 @@ __all__ = [
     "run_interactive_mode",
     "__version__",
 ]
+
+# Public names loaded on first access only (PEP 562), so importing the
+# package (e.g. for the CLI's --help) does not pull in jinja2, chardet or
+# the interactive wizard.
+_LAZY_ATTRS = {
+    "assemble_codebase": ".core",
+    "assemble_from_config": ".core",
+    "AssemblerConfig": ".config",
+    "run_interactive_mode": ".interactive",
+}
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
@@ -5,30 +5,97 @@ This module extracts structural data and patterns from the codebase
 without handling formatting (delegated to templates).
 """
 import os
-from collections import defaultdict
-from pathlib import Path
-from typing import List, Dict, Set, Any
+import re
+from collections import Counter
+from collections.abc import Mapping
+from functools import cached_property
+from operator import itemgetter
+from typing import List, Dict, Any, Iterator, Pattern, Tuple
 
 from .config import FileEntry, CodebaseStats
 from .constants import LANGUAGE_MAP
 
+# Design patterns inferred from filenames: (description, indicators).
+# Indicators are substrings searched in lowercased filenames.
+_PATTERN_INDICATORS: Tuple[Tuple[str, Tuple[str, ...]], ...] = (
+    ("Model-View-Controller pattern detected", ("model.py", "view.py", "controller.py")),
+    ("Organized test structure", ("test_", "__test__", "tests.py", "test.py")),
+    ("Centralized configuration files",
+     (".env", "config.py", "settings.py", "config.yml", "pyproject.toml")),
+    ("Structured documentation", ("readme.md", "docs/", "documentation/")),
+    ("API/Routes architecture", ("routes.py", "api.py", "endpoints.py", "views.py")),
+    ("Persistence/Database layer", ("models.py", "schema.py", "migrations/", "db.py")),
+)
+
+# Each indicator set precompiled into a single alternation, once at import
+_PATTERNS: Tuple[Tuple[str, Pattern[str]], ...] = tuple(
+    (description, re.compile("|".join(re.escape(ind) for ind in indicators)))
+    for description, indicators in _PATTERN_INDICATORS
+)
+
+
+class AnalysisView(Mapping):
+    """
+    Read-only mapping over the analyzer results.
+
+    Each field is computed on first access and cached, so consumers that
+    only read some of the keys do not pay for the others.
+    """
+
+    _KEYS = ("components", "distribution", "patterns", "max_depth", "depth_distribution")
+
+    def __init__(self, analyzer: "ArchitectureAnalyzer"):
+        self._analyzer = analyzer
+
+    @cached_property
+    def components(self) -> List[Dict[str, Any]]:
+        return self._analyzer._get_components()
+
+    @cached_property
+    def distribution(self) -> List[Dict[str, Any]]:
+        return self._analyzer._get_distribution()
+
+    @cached_property
+    def patterns(self) -> List[str]:
+        return self._analyzer._get_patterns()
+
+    @cached_property
+    def depth_distribution(self) -> Dict[int, int]:
+        return self._analyzer._get_depth_distribution()
+
+    @property
+    def max_depth(self) -> int:
+        # The depth distribution syncs stats.max_depth as a side effect
+        _ = self.depth_distribution
+        return self._analyzer.stats.max_depth
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self._KEYS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._KEYS
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._KEYS)
+
+    def __len__(self) -> int:
+        return len(self._KEYS)
+
 
 class ArchitectureAnalyzer:
     """Analyzes codebase structure and detects patterns, returning raw data."""
 
     def __init__(self, entries: List[FileEntry], stats: CodebaseStats):
         self.entries = entries
+        # File entries are split out once; every pass below only needs them
+        self._files = [e for e in entries if e.is_file]
         self.stats = stats
 
-    def analyze_data(self) -> Dict[str, Any]:
-        depth_dist = self._get_depth_distribution()
-        return {
-            "components": self._get_components(),
-            "distribution": self._get_distribution(),
-            "patterns": self._get_patterns(),
-            "max_depth": self.stats.max_depth,
-            "depth_distribution": depth_dist
-        }
+    def analyze_data(self) -> AnalysisView:
+        """Return a lazy view of the analysis; fields are computed on access."""
+        return AnalysisView(self)
 
     def _get_components(self) -> List[Dict[str, Any]]:
         """Identify top-level components relative to the entries."""
@@ -37,105 +104,67 @@ class ArchitectureAnalyzer:
 
         # FIX: os.path.commonpath raises ValueError on Windows when paths span
         # multiple drives (e.g. C:\ and D:\). Fall back gracefully to CWD.
-        all_paths = [Path(e.path) for e in self.entries]
+        # Paths are normalized first, as Path would, so the root is a plain
+        # string prefix of each of them.
+        paths = [os.path.normpath(e.path) for e in self.entries]
         try:
-            root_path = Path(os.path.commonpath([str(p) for p in all_paths]))
+            root = os.path.commonpath(paths)
         except ValueError:
-            root_path = Path(os.getcwd())
-
-        results = []
-        top_dirs: Set[str] = set()
-
-        for entry in self.entries:
-            try:
-                rel_path = Path(entry.path).relative_to(root_path)
-                if len(rel_path.parts) > 1:
-                    top_dirs.add(rel_path.parts[0])
-            except ValueError:
+            root = os.getcwd()
+
+        # Components are the first segments below the root holding any entry;
+        # files are bucketed in the same pass
+        prefix = os.path.join(root, "") if root else ""
+        prefix_len = len(prefix)
+        counts: Counter = Counter()
+        for entry, path in zip(self.entries, paths):
+            if not path.startswith(prefix):
                 continue
-
-        for dir_name in sorted(top_dirs):
-            count = sum(1 for e in self.entries if e.is_file and dir_name in Path(e.path).parts)
-            results.append({"name": dir_name, "count": count})
-
-        return results
+            head, sep, _ = path[prefix_len:].partition(os.sep)
+            if sep:
+                counts[head] += entry.is_file
+        return [{"name": name, "count": count} for name, count in sorted(counts.items())]
 
     def _get_depth_distribution(self) -> Dict[int, int]:
         """Count files at each directory depth level and sync max_depth."""
-        depth_counts: Dict[int, int] = defaultdict(int)
-        for e in self.entries:
-            if e.is_file:
-                depth_counts[e.depth] += 1
+        depth_counts = Counter(e.depth for e in self._files)
 
         if depth_counts:
-            self.stats.max_depth = max(depth_counts.keys())
+            self.stats.max_depth = max(depth_counts)
 
         return dict(sorted(depth_counts.items()))
 
     def _get_distribution(self) -> List[Dict[str, Any]]:
         """Get file distribution by extension and language."""
-        results = []
-        if not self.stats.files_by_ext:
-            return results
-
-        sorted_exts = sorted(
-            self.stats.files_by_ext.items(),
-            key=lambda x: x[1],
-            reverse=True
-        )
-
-        for ext, count in sorted_exts:
-            lang = LANGUAGE_MAP.get(ext, "unknown")
-            percentage = (count / self.stats.total_files * 100) if self.stats.total_files > 0 else 0
-            results.append({
+        files_by_ext = self.stats.files_by_ext
+        if not files_by_ext:
+            return []
+
+        lang_of = LANGUAGE_MAP.get
+        total = self.stats.total_files
+        return [
+            {
                 "ext": ext,
-                "lang": lang,
+                "lang": lang_of(ext, "unknown"),
                 "count": count,
-                "percentage": round(percentage, 1)
-            })
-        return results
+                "percentage": round(count / total * 100 if total > 0 else 0, 1)
+            }
+            for ext, count in sorted(files_by_ext.items(), key=itemgetter(1), reverse=True)
+        ]
 
     def _get_patterns(self) -> List[str]:
         """Detect common design patterns based on filenames."""
-        dir_files: Dict[str, Set[str]] = defaultdict(set)
-        for entry in self.entries:
-            if entry.is_file:
-                parent = str(Path(entry.path).parent)
-                filename = Path(entry.path).name.lower()
-                dir_files[parent].add(filename)
-
-        detected = []
-        patterns_map = {
-            'MVC': {
-                'indicators': ['model.py', 'view.py', 'controller.py'],
-                'description': 'Model-View-Controller pattern detected'
-            },
-            'Testing': {
-                'indicators': ['test_', '__test__', 'tests.py', 'test.py'],
-                'description': 'Organized test structure'
-            },
-            'Configuration': {
-                'indicators': ['.env', 'config.py', 'settings.py', 'config.yml', 'pyproject.toml'],
-                'description': 'Centralized configuration files'
-            },
-            'Documentation': {
-                'indicators': ['readme.md', 'docs/', 'documentation/'],
-                'description': 'Structured documentation'
-            },
-            'API': {
-                'indicators': ['routes.py', 'api.py', 'endpoints.py', 'views.py'],
-                'description': 'API/Routes architecture'
-            },
-            'Database': {
-                'indicators': ['models.py', 'schema.py', 'migrations/', 'db.py'],
-                'description': 'Persistence/Database layer'
-            },
-        }
-
-        for pattern_info in patterns_map.values():
-            for files in dir_files.values():
-                if any(any(ind in f for f in files) for ind in pattern_info['indicators']):
-                    detected.append(pattern_info['description'])
-                    break
-
-        return sorted(list(set(detected)))
\ No newline at end of file
+        # Single pass over the files: each filename is tested once against
+        # the patterns not detected yet.
+        detected: Dict[str, None] = {}
+        for entry in self._files:
+            fname = entry.name_lower
+            for desc, indicator_re in _PATTERNS:
+                if desc in detected:
+                    continue
+                if indicator_re.search(fname):
+                    detected[desc] = None
+            if len(detected) == len(_PATTERNS):
+                break
+
+        return sorted(detected)
\ No newline at end of file
@@ -0,0 +1,107 @@
+"""
+Output cache for Code Assembler Pro.
+
+When a cache directory is configured, each assembled document is stored
+under a key derived from the effective configuration and a fingerprint of
+the document's inputs. Re-running with an unchanged configuration over
+unchanged files then copies the stored document instead of assembling it
+again. A reused document is the stored one unchanged, so its "Snapshot:"
+header and metadata keep the time of the run that produced it.
+
+Cache entries are named '<config digest>-<inputs digest>.md'; storing a
+new entry removes older entries for the same configuration, so the cache
+holds at most one document per configuration.
+"""
+
+import glob
+import hashlib
+import json
+import os
+import shutil
+from typing import TYPE_CHECKING, Optional
+
+from .config import AssemblerConfig
+from .constants import __version__
+
+if TYPE_CHECKING:
+    from .core import CodebaseAssembler
+
+
+def _config_digest(assembler: "CodebaseAssembler", since: Optional[str]) -> str:
+    """Hash everything besides the input files that shapes the output."""
+    config = assembler.config
+    h = hashlib.blake2b(digest_size=16)
+    h.update(__version__.encode())
+    settings = config.to_dict()
+    # Neither setting changes the document itself
+    settings.pop("show_progress", None)
+    settings.pop("cache_dir", None)
+    h.update(json.dumps(settings, sort_keys=True, default=str).encode())
+    h.update(repr((config.exact_filenames, since)).encode())
+    if since and os.path.isfile(since):
+        st = os.stat(since)
+        h.update(f"{st.st_mtime_ns}:{st.st_size}".encode())
+    # The metadata block lists paths relative to the working directory
+    h.update(os.fsencode(os.getcwd()))
+    # Compressed output depends on which optional tree-sitter parsers loaded
+    compressor = assembler.compressor
+    h.update(repr(sorted(compressor.parsers) if compressor is not None else None).encode())
+    return h.hexdigest()
+
+
+def _inputs_digest(assembler: "CodebaseAssembler", cache_dir: str) -> str:
+    """
+    Fingerprint the document's inputs from file metadata only.
+
+    Every step of the assembler's directory walk is included, with the
+    path, mtime and size of each file it reads (README candidates
+    included), so added, removed or edited inputs all change the digest.
+    The output file and the cache directory are left out since they change
+    on every run.
+    """
+    output = os.path.abspath(assembler.config.output_file)
+    cache_prefix = os.path.join(os.path.abspath(cache_dir), "")
+    h = hashlib.blake2b(digest_size=16)
+    for kind, path, depth, st in assembler.iter_inputs():
+        if st is None:
+            h.update(f"{kind}\0{path}\0{depth}\n".encode())
+            continue
+        abs_path = os.path.abspath(path)
+        if abs_path == output or abs_path.startswith(cache_prefix):
+            continue
+        h.update(f"{kind}\0{path}\0{depth}\0{st.st_mtime_ns}\0{st.st_size}\n".encode())
+    return h.hexdigest()
+
+
+def cache_key(assembler: "CodebaseAssembler", since: Optional[str] = None) -> str:
+    """
+    Return the cache entry name for the assembler's configuration and inputs.
+
+    The assembler keeps the directory walk done here, so on a miss the
+    assembly does not walk the tree again.
+    """
+    return f"{_config_digest(assembler, since)}-{_inputs_digest(assembler, assembler.config.cache_dir)}"
+
+
+def restore(config: AssemblerConfig, key: str) -> bool:
+    """Copy a cached document to the output file; return True on a hit."""
+    entry = os.path.join(config.cache_dir, f"{key}.md")
+    if not os.path.isfile(entry):
+        return False
+    try:
+        shutil.copyfile(entry, config.output_file)
+    except OSError:
+        return False
+    return True
+
+
+def store(config: AssemblerConfig, key: str) -> None:
+    """Save the freshly written output file under key (best effort)."""
+    config_digest = key.split("-", 1)[0]
+    try:
+        os.makedirs(config.cache_dir, exist_ok=True)
+        for stale in glob.glob(os.path.join(glob.escape(config.cache_dir), f"{config_digest}-*.md")):
+            os.remove(stale)
+        shutil.copyfile(config.output_file, os.path.join(config.cache_dir, f"{key}.md"))
+    except OSError:
+        pass
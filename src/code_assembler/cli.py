@@ -19,7 +19,6 @@ New in v4.5.2:
 """
 
 import argparse
-import json
 import sys
 from typing import List, Optional
 
@@ -29,7 +28,6 @@ from .constants import (
     DEFAULT_EXCLUDE_PATTERNS,
     EMOJI
 )
-from .core import assemble_codebase, assemble_from_config
 
 
 def _show_excludes() -> None:
@@ -102,6 +100,8 @@ def parse_args() -> argparse.Namespace:
                         help="Disable defaults")
     parser.add_argument("--max-size", type=float, default=DEFAULT_MAX_FILE_SIZE_MB, help="Max size in MB")
     parser.add_argument("--since", "-s", type=str, metavar="SNAPSHOT", help="Delta mode")
+    parser.add_argument("--cache-dir", type=str, metavar="DIR",
+                        help="Reuse the cached output while config and inputs are unchanged")
 
     parser.set_defaults(recursive=True, include_readmes=True, use_default_excludes=True)
     return parser.parse_args()
@@ -122,9 +122,11 @@ def _save_config(args: argparse.Namespace, extensions: List[str]) -> None:
     }
     if args.exclude_patterns:
         config["exclude_patterns"] = args.exclude_patterns
+    if args.cache_dir:
+        config["cache_dir"] = args.cache_dir
 
-    with open(args.save_config, 'w', encoding='utf-8') as f:
-        json.dump(config, f, indent=2, ensure_ascii=False)
+    from .file_io import dump_json_file
+    dump_json_file(args.save_config, config)
 
 
 def main() -> None:
@@ -154,6 +156,9 @@ def main() -> None:
                 print(f"\n{EMOJI['success']} {count} file(s) reconstructed in: {args.output_dir}")
             return
 
+        # core pulls in jinja2 and chardet; only the assembly paths need it
+        from .core import assemble_codebase, assemble_from_config
+
         if args.config:
             # FIX: CLI flags now propagate as overrides into the JSON config path.
             # Previously --compress (and --since) were silently ignored when
@@ -164,10 +169,13 @@ def main() -> None:
             if args.compress:
                 cli_overrides["compress"] = True
                 cli_overrides["compress_level"] = args.compress_level
+            if args.cache_dir:
+                cli_overrides["cache_dir"] = args.cache_dir
 
             content = assemble_from_config(
                 args.config,
                 since=args.since,
+                return_content=args.clip,
                 **cli_overrides,
             )
         else:
@@ -190,6 +198,8 @@ def main() -> None:
                 since=args.since,
                 compress=args.compress,
                 compress_level=args.compress_level,
+                cache_dir=args.cache_dir,
+                return_content=args.clip,
             )
 
         if args.clip and content:
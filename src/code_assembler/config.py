@@ -4,12 +4,39 @@ Configuration classes for Code Assembler Pro.
 This module defines all configuration dataclasses and validation logic.
 """
 
+import os
+import sys
+from collections import Counter
 from dataclasses import dataclass, field
-from pathlib import Path
-from typing import List, Optional
+from functools import cached_property, lru_cache
+from typing import List, Optional, Pattern, Tuple
 
 from .constants import DEFAULT_EXCLUDE_PATTERNS, DEFAULT_MAX_FILE_SIZE_MB
 
+# One FileEntry is created per file and directory: use __slots__ where the
+# dataclass decorator supports it (Python 3.10+)
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Trailing separators FileEntry.name ignores, as Path.name does
+_SEPARATORS = os.sep + (os.altsep or "")
+
+
+@lru_cache(maxsize=256)
+def _classify_extension(ext: str) -> Tuple[str, bool]:
+    """
+    Classify a non-empty --ext value as (normalized value, is exact filename).
+
+    The same handful of values recur across configs, so results are cached.
+    """
+    if ext.startswith('.'):
+        # Already has dot: .py, .env, .env.j2 → extension
+        return ext, False
+    if '.' in ext or not ext[0].isupper():
+        # env.j2 → .env.j2 ; lowercase, no dot: py, md, js → .py, .md, .js
+        return f'.{ext}', False
+    # Starts with uppercase, no dot: Dockerfile, Makefile → exact filename
+    return ext, True
+
 
 @dataclass
 class AssemblerConfig:
@@ -32,6 +59,9 @@ class AssemblerConfig:
         compress_level: Compression depth — "signatures" keeps function/class
                         headers and docstrings; "docstrings_only" is reserved
                         for a future stricter mode.
+        cache_dir: If set, directory where assembled documents are cached and
+                   reused while neither the configuration nor the input
+                   files change.
     """
 
     paths: List[str]
@@ -53,6 +83,9 @@ class AssemblerConfig:
     compress: bool = False
     compress_level: str = "signatures"  # "signatures" | "docstrings_only"
 
+    # --- Output cache ---
+    cache_dir: Optional[str] = None
+
     def __post_init__(self):
         """Validate and normalize configuration after initialization."""
         if not self.paths:
@@ -74,30 +107,32 @@ class AssemblerConfig:
             # FIX: guard against empty strings — ext[0] would raise IndexError
             if not ext:
                 continue
-            if ext.startswith('.'):
-                # Already has dot: .py, .env, .env.j2 → extension
-                normalized_ext.append(ext)
-            elif '.' in ext:
-                # Has internal dot but no leading dot: env.j2 → .env.j2
-                normalized_ext.append(f'.{ext}')
-            elif ext[0].isupper():
-                # Starts with uppercase, no dot: Dockerfile, Makefile → exact filename
-                self.exact_filenames.append(ext)
-            else:
-                # Lowercase, no dot: py, md, js → extension, add dot
-                normalized_ext.append(f'.{ext}')
+            value, is_filename = _classify_extension(ext)
+            (self.exact_filenames if is_filename else normalized_ext).append(value)
 
         self.extensions = normalized_ext
 
         # Add default excludes if requested
         if self.use_default_excludes:
-            self.exclude_patterns = list(set(
-                self.exclude_patterns + DEFAULT_EXCLUDE_PATTERNS
+            # Order-preserving dedup: user patterns first, then defaults
+            self.exclude_patterns = list(dict.fromkeys(
+                [*self.exclude_patterns, *DEFAULT_EXCLUDE_PATTERNS]
             ))
 
         if self.max_file_size_mb <= 0:
             raise ValueError("max_file_size_mb must be positive")
 
+    @cached_property
+    def exclude_regex(self) -> Optional[Pattern[str]]:
+        """All exclusion patterns compiled into one regex (None if there are none)."""
+        from .utils import compile_exclude_patterns
+        return compile_exclude_patterns(self.exclude_patterns)
+
+    def is_excluded(self, path: str) -> bool:
+        """Check whether a path matches any exclusion pattern."""
+        from .utils import is_excluded
+        return is_excluded(path, self.exclude_regex)
+
     @classmethod
     def from_dict(cls, config_dict: dict) -> "AssemblerConfig":
         return cls(**config_dict)
@@ -117,10 +152,11 @@ class AssemblerConfig:
             "use_default_excludes": self.use_default_excludes,
             "compress": self.compress,
             "compress_level": self.compress_level,
+            "cache_dir": self.cache_dir,
         }
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class FileEntry:
     """Represents a file or directory entry in the table of contents."""
     path: str
@@ -131,7 +167,11 @@ class FileEntry:
 
     @property
     def name(self) -> str:
-        return Path(self.path).name
+        return os.path.basename(self.path.rstrip(_SEPARATORS))
+
+    @property
+    def name_lower(self) -> str:
+        return self.name.lower()
 
     @property
     def is_file(self) -> bool:
@@ -150,7 +190,7 @@ class CodebaseStats:
     total_chars: int = 0
     source_chars: int = 0
     estimated_tokens: int = 0
-    files_by_ext: dict = field(default_factory=dict)
+    files_by_ext: Counter = field(default_factory=Counter)
     largest_file: Optional[tuple] = None
     max_depth: int = 0
     skipped_files: List[str] = field(default_factory=list)
@@ -163,9 +203,6 @@ class CodebaseStats:
         self.total_files += 1
         self.total_lines += lines
         self.source_chars += size
-
-        if extension not in self.files_by_ext:
-            self.files_by_ext[extension] = 0
         self.files_by_ext[extension] += 1
 
     def skip_file(self, path: str, reason: str = ""):
@@ -5,14 +5,11 @@ This module contains all constant values used throughout the package,
 including language mappings, file extensions, and default configurations.
 """
 
-from typing import Dict
+from typing import Dict, Tuple
 
-try:
-    from importlib.metadata import version as _get_version
-
-    __version__ = _get_version("code-assembler-pro")
-except Exception:
-    __version__ = "4.5.2"  # Fallback for dev mode without pip install
+# Single source of the package version (read by pyproject.toml at build
+# time), so startup does not pay for an importlib.metadata lookup
+__version__ = "4.5.2"
 
 # Language mapping for syntax highlighting
 LANGUAGE_MAP: Dict[str, str] = {
@@ -151,8 +148,8 @@ LANGUAGE_MAP: Dict[str, str] = {
     ".jsonl": "json",
 }
 
-# Default exclude patterns
-DEFAULT_EXCLUDE_PATTERNS = [
+# Default exclude patterns (immutable, in display order)
+DEFAULT_EXCLUDE_PATTERNS: Tuple[str, ...] = (
     "__pycache__",
     ".pyc",
     ".pyo",
@@ -175,7 +172,7 @@ DEFAULT_EXCLUDE_PATTERNS = [
     ".vscode",
     ".DS_Store",
     "Thumbs.db",
-]
+)
 
 # Common README filenames
 README_FILENAMES = [
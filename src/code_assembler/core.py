@@ -6,16 +6,62 @@ and the final assembly of the Markdown document, including delta analysis
 and metadata injection.
 """
 
+import copy
 import os
+import tempfile
+from collections import deque
+from contextlib import contextmanager
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache, partial
+from itertools import chain, islice
 from pathlib import Path
-from typing import List, Optional, Set
+from typing import Callable, Deque, Dict, Iterable, Iterator, List, Optional, Set, Tuple, TypeVar
 
 from .analyzers import ArchitectureAnalyzer
 from .config import AssemblerConfig, FileEntry, CodebaseStats
-from .constants import README_FILENAMES, EMOJI
-from .file_io import read_file_content, read_file_head
+from .constants import README_FILENAMES, EMOJI, CHARS_PER_TOKEN
+from .file_io import read_file_content, read_file_head, load_json_file
 from .formatters import MarkdownFormatter
-from .utils import should_exclude, get_file_extension, count_lines, estimate_tokens
+from .utils import (
+    is_excluded, is_excluded_entry, split_exclude_patterns, get_file_extension, count_lines
+)
+
+# File reads are latency-bound and release the GIL, so oversubscribe the CPUs
+_READ_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+# Reads submitted ahead of the consumer: enough to keep every worker busy,
+# few enough that waiting results never hold the whole tree in memory
+_READ_AHEAD = 2 * _READ_WORKERS
+
+# The document body stays in memory up to this size, then spills to disk
+_SPOOL_MAX_SIZE = 16 << 20
+_SPOOL_READ_CHARS = 1 << 20
+
+# Case-insensitive forms of README_FILENAMES, to rule out directories
+# without any README candidate straight from their listing
+_README_KEYS = frozenset(name.lower() for name in README_FILENAMES)
+
+_T = TypeVar("_T")
+
+
+def _read_ahead(executor: ThreadPoolExecutor, read: Callable[[str], _T],
+                paths: List[str]) -> Iterator[_T]:
+    """
+    Like executor.map(read, paths), but with at most _READ_AHEAD reads
+    submitted beyond the result being consumed.
+    """
+    remaining = iter(paths)
+    pending: Deque[Future] = deque(
+        executor.submit(read, path) for path in islice(remaining, _READ_AHEAD)
+    )
+    try:
+        while pending:
+            result = pending.popleft().result()
+            for path in islice(remaining, 1):
+                pending.append(executor.submit(read, path))
+            yield result
+    finally:
+        for future in pending:
+            future.cancel()
 
 
 class CodebaseAssembler:
@@ -33,107 +79,205 @@ class CodebaseAssembler:
         self.since = since
         self.since_filter: Optional[Set[str]] = None
         self.deleted_files: Set[str] = set()
+        # stat results gathered by the delta pre-walk, keyed by walk path
+        self._stat_cache: Dict[str, os.stat_result] = {}
+        # Directory walk plans from the delta pre-walk, keyed by config path
+        self._walk_plans: Dict[str, List[Tuple[str, str, int]]] = {}
+        # Walked directories whose listing holds no README candidate
+        self._readme_free: Set[str] = set()
+        # Result of the pre-walk, shared by delta analysis and the cache key
+        self._all_files: Optional[Dict[str, float]] = None
+        # Read pool shared by every directory of the current assembly
+        self._executor: Optional[ThreadPoolExecutor] = None
         self.stats = CodebaseStats()
         self.toc_entries: List[FileEntry] = []
-        self.content_buffer: List[str] = []
+        # Surrogates are passed through so the body round-trips unchanged
+        self._body = tempfile.SpooledTemporaryFile(
+            max_size=_SPOOL_MAX_SIZE, mode='w+', encoding='utf-8',
+            errors='surrogatepass', newline=''
+        )
         self.formatter = MarkdownFormatter()
 
+        # Exclusion patterns are compiled once per config, not once per path
+        self._exclude_re = config.exclude_regex
+        self._exclude_name_re, self._exclude_path_re = split_exclude_patterns(config.exclude_patterns)
+
+        # str.endswith accepts a tuple and checks every suffix in one C call
+        self._ext_suffixes = tuple(config.extensions)
+        self._exact_names = frozenset(config.exact_filenames)
+
+        # Size limit in bytes (scaling by a power of two is exact in floats)
+        self._max_size_bytes = config.max_file_size_mb * 1024 * 1024
+
         # Compression (v4.5) — initialised once so parsers load a single time
         self.compressor = None
         if config.compress:
             from .compressor import CodeCompressor
             self.compressor = CodeCompressor(config.extensions)
 
-    def _collect_all_files(self) -> Set[str]:
-        """Collect all candidate files without processing them."""
-        result: Set[str] = set()
+    def _collect_all_files(self) -> Dict[str, float]:
+        """
+        Collect all candidate files without processing them.
+
+        Returns a mapping of absolute path to modification time, read from
+        the directory walk so delta analysis does not stat files again. The
+        walk plans are kept so process_directory does not traverse the same
+        directories a second time, and the walk itself runs only once.
+        """
+        if self._all_files is not None:
+            return self._all_files
+        result: Dict[str, float] = {}
         for path in self.config.paths:
             if not os.path.exists(path):
                 continue
             if os.path.isfile(path):
-                if self._matches_file(Path(path)):
-                    result.add(os.path.abspath(path))
-            elif os.path.isdir(path):
-                self._collect_dir(path, result)
+                if self._matches_file(os.path.basename(path)):
+                    result[os.path.abspath(path)] = os.path.getmtime(path)
+            elif os.path.isdir(path) and path not in self._walk_plans:
+                plan: List[Tuple[str, str, int]] = []
+                root = str(Path(path))
+                if not is_excluded(root, self._exclude_re):
+                    self._walk_directory(root, 0, plan, result)
+                self._walk_plans[path] = plan
+        self._all_files = result
         return result
 
-    def _collect_dir(self, dir_path: str, result: Set[str]) -> None:
-        """Recursively traverse a directory to collect file paths."""
-        current = Path(dir_path)
-        if should_exclude(str(current), self.config.exclude_patterns):
-            return
-        try:
-            for item in sorted(current.iterdir(), key=lambda p: p.name.lower()):
-                if should_exclude(str(item), self.config.exclude_patterns):
+    def iter_inputs(self) -> Iterator[Tuple[str, str, int, Optional[os.stat_result]]]:
+        """
+        Yield what the document is built from as (kind, path, depth, stat):
+        the files given directly, the steps of each directory walk (with
+        the stat of every file they list) and the README candidates of the
+        visited directories. stat is None for steps that are not files.
+
+        The walk is the pre-walk that assembly then reuses, so listing the
+        inputs does not cost a second traversal.
+        """
+        self._collect_all_files()
+        for path in self.config.paths:
+            if os.path.isfile(path):
+                try:
+                    st = os.stat(path)
+                except OSError:
                     continue
-                if item.is_file() and self._matches_file(item):
-                    result.add(os.path.abspath(str(item)))
-                elif item.is_dir() and self.config.recursive:
-                    self._collect_dir(str(item), result)
-        except PermissionError:
-            pass
-
-    def _matches_file(self, filepath: Path) -> bool:
-        """Check if a file matches configured extensions or exact filenames."""
-        name = filepath.name
-        if any(name.endswith(ext) for ext in self.config.extensions):
-            return True
-        if name in self.config.exact_filenames:
-            return True
-        return False
+                yield 'file', path, 0, st
+            for kind, step_path, depth in self._walk_plans.get(path, ()):
+                yield kind, step_path, depth, self._stat_cache.get(step_path)
+                if (kind == 'enter' and self.config.include_readmes
+                        and step_path not in self._readme_free):
+                    for readme_name in README_FILENAMES:
+                        readme_path = os.path.join(step_path, readme_name)
+                        try:
+                            st = os.stat(readme_path)
+                        except OSError:
+                            continue
+                        yield 'readme', readme_path, depth, st
+
+    def _emit(self, block: str) -> None:
+        """Append a Markdown block to the document body."""
+        self._body.write(block)
+        self.stats.total_chars += len(block)
+
+    def _iter_body(self) -> Iterator[str]:
+        """Yield the document body back in blocks, then release it."""
+        body = self._body
+        try:
+            body.seek(0)
+            yield from iter(partial(body.read, _SPOOL_READ_CHARS), "")
+        finally:
+            body.close()
+
+    def _matches_file(self, name: str) -> bool:
+        """Check if a filename matches configured extensions or exact filenames."""
+        return name.endswith(self._ext_suffixes) or name in self._exact_names
+
+    def _read_file(self, file_path: str) -> Tuple[str, int, bool, Optional[str]]:
+        """
+        Read a file's content, truncating it if it exceeds the size limit.
 
-    def process_file(self, file_path: str, depth: int = 0) -> bool:
+        Touches no shared state, so it can run in worker threads. Returns
+        (content, size_bytes, is_truncated, skip_reason); skip_reason is set
+        when the file must be left out of the assembly.
+        """
+        try:
+            st = self._stat_cache.get(file_path)
+            size_bytes = st.st_size if st is not None else os.path.getsize(file_path)
+
+            if size_bytes > self._max_size_bytes:
+                if not self.config.truncate_large_files:
+                    size_mb = size_bytes / (1024 * 1024)
+                    return "", size_bytes, False, f"too large: {size_mb:.1f}MB"
+                limit = self.config.truncation_limit_lines
+                content = read_file_head(file_path, limit)
+                content += (
+                    f"\n\n# ... [TRUNCATED] ...\n"
+                    f"# Content truncated because > {self.config.max_file_size_mb}MB.\n"
+                    f"# Only the first {limit} lines are shown for context."
+                )
+                return content, size_bytes, True, None
+
+            content = read_file_content(file_path)
+        except OSError as e:
+            return "", 0, False, f"system error: {e}"
+
+        if content.startswith("[ERROR]"):
+            return "", size_bytes, False, "read error"
+        return content, size_bytes, False, None
+
+    @contextmanager
+    def _read_pool(self) -> Iterator[None]:
+        """Provide one read pool for everything processed inside the block."""
+        if self._executor is not None:
+            yield
+            return
+        # Worker threads only start on the first submitted read
+        with ThreadPoolExecutor(max_workers=_READ_WORKERS) as self._executor:
+            try:
+                yield
+            finally:
+                self._executor = None
+
+    def _iter_reads(self, paths: List[str]) -> Iterator[Tuple[str, int, bool, Optional[str]]]:
+        """Read paths in order, on the read pool when there is anything to overlap."""
+        if len(paths) < 2 or self._executor is None:
+            return map(self._read_file, paths)
+        return _read_ahead(self._executor, self._read_file, paths)
+
+    def process_file(self, file_path: str, depth: int = 0,
+                     prefetched: Optional[Tuple[str, int, bool, Optional[str]]] = None) -> bool:
         """
         Process a single file and add its content to the buffer.
         Handles large files by truncating them if configured.
         When compression is active, reduces content to signatures + docstrings.
+
+        Args:
+            prefetched: Result of _read_file() obtained ahead of time (e.g.
+                        by a worker thread); the file is read here if omitted.
         """
         if self.since_filter is not None and os.path.abspath(file_path) not in self.since_filter:
             return False
 
-        try:
-            size_bytes = os.path.getsize(file_path)
-            size_mb = size_bytes / (1024 * 1024)
-            content = ""
-            is_truncated = False
-
-            if size_mb > self.config.max_file_size_mb:
-                if self.config.truncate_large_files:
-                    limit = self.config.truncation_limit_lines
-                    content = read_file_head(file_path, limit)
-                    content += (
-                        f"\n\n# ... [TRUNCATED] ...\n"
-                        f"# Content truncated because > {self.config.max_file_size_mb}MB.\n"
-                        f"# Only the first {limit} lines are shown for context."
-                    )
-                    is_truncated = True
-                    if self.config.show_progress:
-                        print(f"  {EMOJI['warning']}  Truncated (too large): {Path(file_path).name}")
-                else:
-                    self.stats.skip_file(file_path, f"too large: {size_mb:.1f}MB")
-                    return False
-            else:
-                content = read_file_content(file_path)
+        if prefetched is None:
+            prefetched = self._read_file(file_path)
+        content, size_bytes, is_truncated, skip_reason = prefetched
 
-        except OSError as e:
-            self.stats.skip_file(file_path, f"system error: {e}")
+        if skip_reason:
+            self.stats.skip_file(file_path, skip_reason)
             return False
 
-        if content.startswith("[ERROR]"):
-            self.stats.skip_file(file_path, "read error")
-            return False
+        if is_truncated and self.config.show_progress:
+            print(f"  {EMOJI['warning']}  Truncated (too large): {os.path.basename(file_path)}")
 
         # Compression injection — skipped for truncated files to avoid double-mangling
         if self.compressor is not None and not is_truncated:
             content = self.compressor.compress(content, file_path)
 
         line_count = count_lines(content)
-        md_block = self.formatter.format_file_block(
-            file_path=file_path, content=content, depth=depth,
-            size_bytes=size_bytes, line_count=line_count
-        )
-
-        self.content_buffer.append(md_block)
+        # Written piece by piece so the content is not copied into a block string
+        for piece in self.formatter.iter_file_block(
+                file_path=file_path, content=content, depth=depth,
+                size_bytes=size_bytes, line_count=line_count
+        ):
+            self._emit(piece)
         self.stats.add_file(get_file_extension(file_path), line_count, size_bytes)
         self.stats.update_largest_file(file_path, size_bytes)
         self.toc_entries.append(FileEntry(
@@ -143,60 +287,158 @@ class CodebaseAssembler:
 
         if self.config.show_progress and not is_truncated:
             compress_tag = " [compressed]" if self.compressor else ""
-            print(f"  {EMOJI['success']} {Path(file_path).name} ({line_count:,} lines{compress_tag})")
+            print(f"  {EMOJI['success']} {os.path.basename(file_path)} ({line_count:,} lines{compress_tag})")
 
         return True
 
     def process_readme(self, dir_path: str, depth: int = 0) -> bool:
         """Process README file if it exists in the directory for context."""
+        if dir_path in self._readme_free:
+            return False
         for readme_name in README_FILENAMES:
             readme_path = os.path.join(dir_path, readme_name)
-            if os.path.exists(readme_path) and not should_exclude(readme_path, self.config.exclude_patterns):
+            if os.path.exists(readme_path) and not is_excluded(readme_path, self._exclude_re):
                 content = read_file_content(readme_path)
                 if not content.startswith("[ERROR]"):
-                    self.content_buffer.append(self.formatter.format_readme_context(content, depth))
+                    self._emit(self.formatter.format_readme_context(content, depth))
                     if self.config.show_progress:
                         print(f"  {EMOJI['readme']}  README found: {readme_name}")
                     return True
         return False
 
-    def process_directory(self, dir_path: str, depth: int = 0) -> None:
-        """Process a directory recursively."""
-        current_path = Path(dir_path)
-        if should_exclude(str(current_path), self.config.exclude_patterns):
-            return
+    def _scan_directory(
+            self,
+            dir_path: str,
+            depth: int,
+            plan: List[Tuple[str, str, int]]
+    ) -> Optional[List[os.DirEntry]]:
+        """
+        Record the visit of a directory in the plan and return its entries
+        sorted by name, or None when it cannot be listed.
+        """
+        plan.append(('enter', dir_path, depth))
+        try:
+            with os.scandir(dir_path) as it:
+                items = sorted(it, key=lambda e: e.name.lower())
+        except PermissionError:
+            plan.append(('denied', dir_path, depth))
+            return None
+
+        if self.config.include_readmes and not any(e.name.lower() in _README_KEYS for e in items):
+            self._readme_free.add(dir_path)
+        return items
+
+    def _walk_directory(
+            self,
+            dir_path: str,
+            depth: int,
+            plan: List[Tuple[str, str, int]],
+            mtimes: Optional[Dict[str, float]] = None
+    ) -> None:
+        """
+        Traverse a directory depth-first, recording in traversal order what
+        process_directory must emit: ('enter', dir, depth) when a directory
+        is visited, ('dir', subdir, depth) for its header, ('file', path,
+        depth) for each matching file and ('denied', dir, depth) when it
+        cannot be listed.
 
-        if self.config.show_progress:
-            print(f"{'  ' * depth}{EMOJI['folder']} {current_path.name}")
+        When mtimes is given, matching files are also stat'ed and their
+        modification times recorded by absolute path.
 
-        try:
-            if self.config.include_readmes:
-                self.process_readme(str(current_path), depth)
+        dir_path itself must already have passed the exclusion check; the
+        subdirectories are checked in the loop below before descending.
+        """
+        items = self._scan_directory(dir_path, depth, plan)
+        if items is None:
+            return
 
-            items = sorted(current_path.iterdir(), key=lambda p: p.name.lower())
-            for item in items:
-                if should_exclude(str(item), self.config.exclude_patterns):
+        # An explicit stack of partly consumed listings instead of recursion:
+        # no frame per directory and no recursion limit on deep trees
+        stack: List[Tuple[Iterator[os.DirEntry], int]] = [(iter(items), depth)]
+        name_re, path_re = self._exclude_name_re, self._exclude_path_re
+        while stack:
+            entries, item_depth = stack[-1]
+            for item in entries:
+                if is_excluded_entry(item, name_re, path_re):
                     continue
-                if item.is_file() and self._matches_file(item):
-                    self.process_file(str(item), depth)
-                elif item.is_dir() and self.config.recursive:
-                    self.content_buffer.append(self.formatter.format_directory_header(str(item), depth))
-                    self.toc_entries.append(FileEntry(path=str(item), type='dir', depth=depth))
-                    self.process_directory(str(item), depth + 1)
-        except PermissionError:
-            self.stats.skip_file(str(current_path), "permission denied")
+                try:
+                    if item.is_file() and self._matches_file(item.name):
+                        if mtimes is not None:
+                            st = item.stat()
+                            self._stat_cache[item.path] = st
+                            mtimes[os.path.abspath(item.path)] = st.st_mtime
+                        plan.append(('file', item.path, item_depth))
+                    elif item.is_dir() and self.config.recursive:
+                        plan.append(('dir', item.path, item_depth))
+                        sub_items = self._scan_directory(item.path, item_depth + 1, plan)
+                        if sub_items is not None:
+                            # Descend now; this listing resumes once it is done
+                            stack.append((iter(sub_items), item_depth + 1))
+                            break
+                except OSError:
+                    continue
+            else:
+                stack.pop()
+
+    def process_directory(self, dir_path: str, depth: int = 0) -> None:
+        """
+        Process a directory recursively.
+
+        The tree is walked first; file contents are then read by a thread
+        pool while blocks are emitted serially in traversal order, so disk
+        reads overlap with compression and formatting.
+        """
+        plan = self._walk_plans.pop(dir_path, None) if depth == 0 else None
+        if plan is None:
+            plan = []
+            # Normalized once here; paths below are built by plain joins
+            root = str(Path(dir_path))
+            if not is_excluded(root, self._exclude_re):
+                self._walk_directory(root, depth, plan)
+        if self.since_filter is not None:
+            plan = [
+                step for step in plan
+                if step[0] != 'file' or os.path.abspath(step[1]) in self.since_filter
+            ]
+
+        file_paths = [path for kind, path, _ in plan if kind == 'file']
+        with self._read_pool():
+            reads = self._iter_reads(file_paths)
+            for kind, path, item_depth in plan:
+                if kind == 'file':
+                    self.process_file(path, item_depth, prefetched=next(reads))
+                elif kind == 'dir':
+                    self._emit(self.formatter.format_directory_header(path, item_depth))
+                    self.toc_entries.append(FileEntry(path=path, type='dir', depth=item_depth))
+                elif kind == 'enter':
+                    if self.config.show_progress:
+                        print(f"{'  ' * item_depth}{EMOJI['folder']} {Path(path).name}")
+                    if self.config.include_readmes:
+                        self.process_readme(path, item_depth)
+                else:
+                    self.stats.skip_file(path, "permission denied")
 
     def assemble(self) -> str:
         """Assemble the complete codebase into a single Markdown string."""
+        return "".join(self.assemble_chunks())
+
+    def assemble_chunks(self) -> Iterable[str]:
+        """
+        Assemble the complete codebase as an ordered, single-use iterable
+        of Markdown chunks.
+
+        File blocks are spooled as they are produced, so writing the chunks
+        out one by one never holds the whole document in memory.
+        """
         delta_summary = ""
         if self.since and os.path.exists(self.since):
-            from .delta import filter_changed_files, get_delta, format_delta_summary
+            from .delta import get_delta, format_delta_summary
             all_files = self._collect_all_files()
-            files_to_assemble, self.deleted_files = filter_changed_files(self.since, all_files)
+            modified, added, self.deleted_files = get_delta(self.since, set(all_files), all_files)
+            files_to_assemble = modified | added
             self.since_filter = files_to_assemble
 
-            modified, added, deleted = get_delta(self.since, all_files)
-            delta_summary = format_delta_summary(modified, added, deleted)
+            delta_summary = format_delta_summary(modified, added, self.deleted_files)
 
             if self.config.show_progress:
                 print(f"\n{EMOJI['mag']} Delta mode: {len(files_to_assemble)} file(s) changed")
@@ -205,34 +447,41 @@ class CodebaseAssembler:
             compress_info = f" (compress={self.config.compress_level})" if self.config.compress else ""
             print(f"\n{EMOJI['rocket']} Starting assembly{compress_info}...\n")
 
-        for path in self.config.paths:
-            if not os.path.exists(path):
-                continue
-            if os.path.isfile(path):
-                if self._matches_file(Path(path)):
-                    self.process_file(path)
-            elif os.path.isdir(path):
-                self.process_directory(path)
-
-        full_content = "".join(self.content_buffer)
-        self.stats.total_chars = len(full_content)
-        self.stats.estimated_tokens = estimate_tokens(full_content)
+        # Files given directly are read ahead on a thread pool as well, so
+        # a long list of them (e.g. a shell glob) is not read one by one
+        file_roots = [
+            path for path in self.config.paths
+            if os.path.isfile(path) and self._matches_file(os.path.basename(path))
+            and (self.since_filter is None or os.path.abspath(path) in self.since_filter)
+        ]
+        wanted = set(file_roots)
+        with self._read_pool():
+            reads = self._iter_reads(file_roots)
+            for path in self.config.paths:
+                if path in wanted:
+                    self.process_file(path, prefetched=next(reads))
+                elif os.path.isdir(path):
+                    self.process_directory(path)
+
+        # Estimated from the exact total rather than summed per block, which
+        # would round down once per block
+        self.stats.estimated_tokens = self.stats.total_chars // CHARS_PER_TOKEN
 
         toc = self.formatter.generate_toc(self.toc_entries)
         analyzer = ArchitectureAnalyzer(self.toc_entries, self.stats)
         archi_data = analyzer.analyze_data()
         architecture_md = self.formatter.render("components/architecture.md.j2", archi_data)
 
-        header = self.formatter.generate_header(self.stats, self.config, toc, architecture_md)
-        if delta_summary:
-            header = header.replace("---", f"{delta_summary}\n\n---", 1)
+        header = self.formatter.iter_header(
+            self.stats, self.config, toc, architecture_md, delta_summary
+        )
 
         metadata_block = self.formatter.generate_metadata_block(self.toc_entries)
 
         if self.config.show_progress:
             self._print_summary()
 
-        return header + "\n\n" + full_content + metadata_block
+        return chain(header, ("\n\n",), self._iter_body(), (metadata_block,))
 
     def _print_summary(self) -> None:
         """Print assembly summary to console."""
@@ -253,9 +502,16 @@ def assemble_codebase(
         exclude_patterns: Optional[List[str]] = None,
         output: str = "codebase.md",
         since: Optional[str] = None,
+        return_content: bool = True,
         **kwargs
-) -> str:
-    """Main entry point function to assemble a codebase."""
+) -> Optional[str]:
+    """
+    Main entry point function to assemble a codebase.
+
+    The document is streamed to ``output``. Pass ``return_content=False``
+    when the Markdown string itself is not needed, to avoid building it
+    in memory; None is returned in that case.
+    """
     from .file_io import write_file_content
 
     if 'output_file' in kwargs:
@@ -268,22 +524,60 @@ def assemble_codebase(
     )
 
     assembler = CodebaseAssembler(config, since=since)
-    content = assembler.assemble()
 
-    if not write_file_content(output, content):
+    key = None
+    if config.cache_dir:
+        from . import cache
+        key = cache.cache_key(assembler, since)
+        if cache.restore(config, key):
+            if config.show_progress:
+                print(f"\n{EMOJI['recycle']} Inputs unchanged, reused cached output: {output}\n")
+            if not return_content:
+                return None
+            with open(output, 'r', encoding='utf-8') as f:
+                return f.read()
+
+    chunks = assembler.assemble_chunks()
+    content = "".join(chunks) if return_content else None
+
+    if not write_file_content(output, chunks if content is None else content):
         raise OSError(f"Failed to write output file: {output}")
 
+    if key is not None:
+        cache.store(config, key)
+
     if config.show_progress:
         print(f"\n{EMOJI['floppy']} Saved: {output}\n")
 
     return content
 
 
+@lru_cache(maxsize=32)
+def _load_config_cached(config_file: str, mtime_ns: int, size: int) -> dict:
+    """
+    Parse a JSON configuration file.
+
+    The modification time and size are part of the cache key, so editing
+    the file invalidates the entry automatically, even on filesystems with
+    a coarse mtime resolution.
+    """
+    return load_json_file(config_file)
+
+
+def _load_config(config_file: str) -> dict:
+    """Return a private copy of the parsed config, reusing cached parses."""
+    st = os.stat(config_file)
+    return copy.deepcopy(
+        _load_config_cached(os.path.abspath(config_file), st.st_mtime_ns, st.st_size)
+    )
+
+
 def assemble_from_config(
         config_file: str,
         since: Optional[str] = None,
+        return_content: bool = True,
         **cli_overrides
-) -> str:
+) -> Optional[str]:
     """
     Assemble codebase using a JSON configuration file.
 
@@ -294,9 +588,7 @@ def assemble_from_config(
     Example:
         assemble_from_config("config.json", since="prev.md", compress=True)
     """
-    import json
-    with open(config_file, 'r', encoding='utf-8') as f:
-        config_data = json.load(f)
+    config_data = _load_config(config_file)
 
     # Normalise output key
     if 'output_file' in config_data and 'output' not in config_data:
@@ -310,4 +602,4 @@ def assemble_from_config(
         if value is not None:
             config_data[key] = value
 
-    return assemble_codebase(since=since, **config_data)
\ No newline at end of file
+    return assemble_codebase(since=since, return_content=return_content, **config_data)
\ No newline at end of file
@@ -10,29 +10,73 @@ since the last assembly.
 import json
 import os
 import re
+import time
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Set, Tuple
+from typing import Dict, List, Optional, Set, Tuple
+
+from .file_io import loads_json
 
 _METADATA_RE = re.compile(r'<!-- CODE_ASSEMBLER_METADATA\s+(.*?)\s+-->', re.DOTALL)
+_METADATA_MARKER = b'<!-- CODE_ASSEMBLER_METADATA'
+
+# Initial size of the window read from the end of a snapshot
+_TAIL_CHUNK = 64 * 1024
+
+
+def _read_metadata_tail(md_file: str) -> Optional[str]:
+    """
+    Return the snapshot text starting at its last metadata marker.
+
+    The metadata block is appended at the very end of a snapshot, so only
+    a growing window at the end of the file is read instead of the whole
+    document. Returns None when the snapshot has no marker at all.
+    """
+    with open(md_file, 'rb') as f:
+        size = f.seek(0, os.SEEK_END)
+        window = _TAIL_CHUNK
+        while True:
+            start = max(0, size - window)
+            f.seek(start)
+            data = f.read()
+            pos = data.rfind(_METADATA_MARKER)
+            if pos != -1:
+                return data[pos:].decode('utf-8')
+            if start == 0:
+                return None
+            window *= 4
+
+
+def _parse_snapshot_time(date_str: str) -> datetime:
+    """Parse a '%Y-%m-%d %H:%M' timestamp as written by the formatter."""
+    # The written form is zero-padded, which fromisoformat parses far faster
+    # than strptime; anything else goes through strptime as the reference
+    if len(date_str) == 16 and date_str[10] == ' ' and date_str[13] == ':':
+        try:
+            return datetime.fromisoformat(date_str)
+        except ValueError:
+            pass
+    return datetime.strptime(date_str, "%Y-%m-%d %H:%M")
 
 
 def extract_metadata(md_file: str) -> Dict[str, datetime]:
     """Extract the {path: datetime} dict from the hidden metadata block."""
     result: Dict[str, datetime] = {}
     try:
-        with open(md_file, 'r', encoding='utf-8') as f:
-            content = f.read()
-
-        match = _METADATA_RE.search(content)
+        tail = _read_metadata_tail(md_file)
+        match = _METADATA_RE.search(tail) if tail is not None else None
+        if tail is not None and not match:
+            # Marker without a well-formed block after it: scan everything
+            with open(md_file, 'r', encoding='utf-8') as f:
+                match = _METADATA_RE.search(f.read())
         if not match:
             # Old snapshot without metadata — caller treats all files as new
             return result
 
-        data = json.loads(match.group(1))
+        data = loads_json(match.group(1))
         for path, date_str in data.get('files', {}).items():
             try:
-                result[path] = datetime.strptime(date_str, "%Y-%m-%d %H:%M")
+                result[path] = _parse_snapshot_time(date_str)
             except ValueError:
                 continue
 
@@ -54,7 +98,19 @@ def normalize_key(path: str) -> str:
     return str(Path(path)).replace('\\', '/').lower().strip('/')
 
 
-def get_delta(md_file: str, current_files: Set[str]) -> Tuple[Set[str], Set[str], Set[str]]:
+def get_delta(
+        md_file: str,
+        current_files: Set[str],
+        mtimes: Optional[Dict[str, float]] = None
+) -> Tuple[Set[str], Set[str], Set[str]]:
+    """
+    Compare current files against the snapshot metadata.
+
+    ``mtimes`` optionally maps absolute paths to modification times already
+    collected during the directory walk, so no further stat is needed.
+    """
+    if mtimes is None:
+        mtimes = {}
     snapshot = extract_metadata(md_file)
 
     # No metadata → treat everything as new (backwards compat with old snapshots)
@@ -68,7 +124,12 @@ def get_delta(md_file: str, current_files: Set[str]) -> Tuple[Set[str], Set[str]
 
     if current_files:
         try:
-            common_root = os.path.commonpath(list(current_files))
+            # The common path of the extremes (in commonpath's own ordering)
+            # is that of the whole set, without splitting every path
+            common_root = os.path.commonpath([
+                min(current_files, key=os.path.normcase),
+                max(current_files, key=os.path.normcase),
+            ])
             if os.path.isfile(common_root):
                 common_root = os.path.dirname(common_root)
         except ValueError:
@@ -76,6 +137,13 @@ def get_delta(md_file: str, current_files: Set[str]) -> Tuple[Set[str], Set[str]
     else:
         common_root = os.getcwd()
 
+    # Fuzzy matching only ever pairs files with the same name, so index the
+    # snapshot by file name (keeping snapshot order) to look up candidates.
+    # Keys are already in forward-slash form, so a plain split gives the name.
+    snap_by_name: Dict[str, List[str]] = {}
+    for snap_key in snapshot:
+        snap_by_name.setdefault(snap_key.rsplit('/', 1)[-1], []).append(snap_key)
+
     for abs_path in current_files:
         try:
             rel_path = os.path.relpath(abs_path, common_root).replace('\\', '/')
@@ -89,15 +157,14 @@ def get_delta(md_file: str, current_files: Set[str]) -> Tuple[Set[str], Set[str]
         if rel_path in snapshot:
             match_key = rel_path
         else:
-            for snap_key in snapshot:
+            for snap_key in snap_by_name.get(rel_path.rsplit('/', 1)[-1], ()):
                 if rel_path.endswith(snap_key) or snap_key.endswith(rel_path):
-                    if Path(rel_path).name == Path(snap_key).name:
-                        match_key = snap_key
-                        break
+                    match_key = snap_key
+                    break
 
         if match_key:
             matched_keys.add(match_key)
-            if _has_changed(abs_path, snapshot[match_key]):
+            if _has_changed(abs_path, snapshot[match_key], mtimes.get(abs_path)):
                 modified.add(abs_path)
         else:
             added.add(abs_path)
@@ -109,19 +176,25 @@ def get_delta(md_file: str, current_files: Set[str]) -> Tuple[Set[str], Set[str]
     return modified, added, deleted
 
 
-def _has_changed(abs_path: str, snapshot_dt: datetime) -> bool:
+def _has_changed(abs_path: str, snapshot_dt: datetime, mtime: Optional[float] = None) -> bool:
     try:
-        current_mtime = datetime.fromtimestamp(
-            os.path.getmtime(abs_path)
-        ).replace(second=0, microsecond=0)
-        snapshot_mtime = snapshot_dt.replace(second=0, microsecond=0)
-        return current_mtime != snapshot_mtime
+        if mtime is None:
+            mtime = os.path.getmtime(abs_path)
+        # Local wall-clock minute on both sides, compared field by field
+        current = time.localtime(mtime)
+        return (current.tm_year, current.tm_mon, current.tm_mday, current.tm_hour, current.tm_min) != (
+            snapshot_dt.year, snapshot_dt.month, snapshot_dt.day, snapshot_dt.hour, snapshot_dt.minute
+        )
     except OSError:
         return True
 
 
-def filter_changed_files(md_file: str, all_files: Set[str]) -> Tuple[Set[str], Set[str]]:
-    modified, added, deleted = get_delta(md_file, all_files)
+def filter_changed_files(
+        md_file: str,
+        all_files: Set[str],
+        mtimes: Optional[Dict[str, float]] = None
+) -> Tuple[Set[str], Set[str]]:
+    modified, added, deleted = get_delta(md_file, all_files, mtimes)
     return modified | added, deleted
 
 
@@ -4,9 +4,28 @@ File I/O operations for Code Assembler Pro.
 This module handles all file reading and encoding detection operations.
 """
 
-from typing import Optional
-
-import chardet
+import codecs
+import json
+from itertools import islice
+from typing import Any, Iterable, Optional, Union
+
+try:
+    import orjson
+except ImportError:  # optional speedup, stdlib json is the fallback
+    orjson = None
+
+# Output is written through a large buffer so that many small chunks
+# turn into few write syscalls
+_WRITE_BUFFER_SIZE = 1 << 20
+
+# UTF-32 marks first: the UTF-32-LE one starts with the UTF-16-LE one
+_BOMS = (
+    (codecs.BOM_UTF32_LE, 'UTF-32'),
+    (codecs.BOM_UTF32_BE, 'UTF-32'),
+    (codecs.BOM_UTF8, 'UTF-8-SIG'),
+    (codecs.BOM_UTF16_LE, 'UTF-16'),
+    (codecs.BOM_UTF16_BE, 'UTF-16'),
+)
 
 
 def detect_encoding(file_path: str) -> str:
@@ -16,21 +35,27 @@ def detect_encoding(file_path: str) -> str:
     """
     SAMPLE_SIZE = 65536  # 64KB is enough for reliable detection
 
+    with open(file_path, 'rb') as f:
+        raw_data = f.read(SAMPLE_SIZE)
+
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            f.read(SAMPLE_SIZE)
+        # A multi-byte sequence may be cut at the end of a partial sample
+        codecs.getincrementaldecoder('utf-8')().decode(raw_data, final=len(raw_data) < SAMPLE_SIZE)
         return 'utf-8'
     except UnicodeDecodeError:
         pass
-    except FileNotFoundError:
-        raise
+
+    # Byte order marks settle it without running chardet (same names it reports)
+    for bom, name in _BOMS:
+        if raw_data.startswith(bom):
+            return name
 
     try:
-        with open(file_path, 'rb') as f:
-            raw_data = f.read(SAMPLE_SIZE)
-            result = chardet.detect(raw_data)
-            detected_encoding = result.get('encoding')
-            return detected_encoding if detected_encoding else 'utf-8'
+        # Imported here: it is slow to load and most runs never get this far
+        import chardet
+        result = chardet.detect(raw_data)
+        detected_encoding = result.get('encoding')
+        return detected_encoding if detected_encoding else 'utf-8'
     except Exception:
         return 'utf-8'
 
@@ -41,7 +66,19 @@ def read_file_content(file_path: str, encoding: Optional[str] = None) -> str:
     """
     try:
         if encoding is None:
-            encoding = detect_encoding(file_path)
+            # Fast path: a file that is valid UTF-8 throughout is opened
+            # and read once instead of being sampled and then reopened
+            with open(file_path, 'rb') as f:
+                data = f.read()
+            try:
+                text = data.decode('utf-8')
+            except UnicodeDecodeError:
+                encoding = detect_encoding(file_path)
+            else:
+                # Same universal-newline translation as text mode
+                if '\r' in text:
+                    text = text.replace('\r\n', '\n').replace('\r', '\n')
+                return text
 
         with open(file_path, 'r', encoding=encoding, errors='replace') as f:
             return f.read()
@@ -54,13 +91,18 @@ def read_file_content(file_path: str, encoding: Optional[str] = None) -> str:
         return f"[ERROR] Error reading file: {str(e)}"
 
 
-def write_file_content(file_path: str, content: str, encoding: str = 'utf-8') -> bool:
+def write_file_content(file_path: str, content: Union[str, Iterable[str]],
+                       encoding: str = 'utf-8') -> bool:
     """
-    Write content to a file.
+    Write content to a file. Content may be a string or an iterable of
+    string chunks, which are streamed without being joined first.
     """
     try:
-        with open(file_path, 'w', encoding=encoding) as f:
-            f.write(content)
+        with open(file_path, 'w', encoding=encoding, buffering=_WRITE_BUFFER_SIZE) as f:
+            if isinstance(content, str):
+                f.write(content)
+            else:
+                f.writelines(content)
         return True
     except Exception as e:
         print(f"[ERROR] Error writing file {file_path}: {e}")
@@ -74,14 +116,68 @@ def read_file_head(file_path: str, max_lines: int, encoding: Optional[str] = Non
     if encoding is None:
         encoding = detect_encoding(file_path)
 
-    lines = []
     try:
         with open(file_path, 'r', encoding=encoding, errors='replace') as f:
-            for _ in range(max_lines):
-                line = f.readline()
-                if not line:
-                    break
-                lines.append(line)
-        return "".join(lines)
+            # islice stops at EOF on its own; a negative count reads nothing
+            return "".join(islice(f, max(max_lines, 0)))
     except Exception as e:
         return f"[ERROR] Error reading file head: {str(e)}"
+
+
+def loads_json(data: Union[str, bytes]) -> Any:
+    """
+    Parse a JSON document, using orjson when it is installed.
+
+    Raises json.JSONDecodeError on invalid content with either backend.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:  # json also accepts escaped lone surrogates
+            pass
+    return json.loads(data)
+
+
+def dumps_json(data: Any) -> str:
+    """
+    Serialize data exactly as json.dumps(data, indent=2) would, using
+    orjson when it is installed. Meant for string-valued documents such
+    as snapshot metadata.
+    """
+    if orjson is not None:
+        try:
+            payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        except orjson.JSONEncodeError:  # e.g. lone surrogates from odd file names
+            payload = None
+        # json escapes non-ASCII characters and DEL, orjson leaves them raw
+        if payload is not None and payload.isascii() and b'\x7f' not in payload:
+            return payload.decode('ascii')
+    return json.dumps(data, indent=2)
+
+
+def load_json_file(file_path: str) -> Any:
+    """Parse a JSON file, using orjson when it is installed."""
+    with open(file_path, 'rb') as f:
+        return loads_json(f.read())
+
+
+def dump_json_file(file_path: str, data: Any) -> None:
+    """
+    Write data as 2-space indented UTF-8 JSON, using orjson when installed.
+
+    The document is serialized to bytes first and written in one call.
+    Strings with no UTF-8 form (lone surrogates) are written escaped.
+    """
+    payload = None
+    if orjson is not None:
+        try:
+            payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        except orjson.JSONEncodeError:  # e.g. lone surrogates from odd file names
+            pass
+    if payload is None:
+        try:
+            payload = json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+        except UnicodeEncodeError:
+            payload = json.dumps(data, indent=2).encode('ascii')
+    with open(file_path, 'wb') as f:
+        f.write(payload)
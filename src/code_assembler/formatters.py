@@ -5,18 +5,58 @@ This module handles the transformation of analyzed codebase data into
 structured Markdown, including the generation of a hidden metadata block
 for delta analysis.
 """
-import json
 import os
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterator, Mapping, Optional, Set
 
-from jinja2 import Environment, FileSystemLoader
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, Template, meta
+from jinja2.bccache import Bucket
 
 from .config import FileEntry, CodebaseStats, AssemblerConfig
 from .constants import LANGUAGE_MAP, EMOJI, __version__
+from .file_io import dumps_json
 from .utils import slugify_path, format_file_size, format_number
 
+# Languages of extension-less special files, keyed by lowercased filename
+_FILENAME_LANGUAGES: Dict[str, str] = {
+    "dockerfile": "dockerfile",
+    "makefile": "makefile",
+    "procfile": "ruby",
+    "cmakelists.txt": "cmake",
+}
+
+
+class _BytecodeCache(FileSystemBytecodeCache):
+    """Compiled-template cache whose I/O failures never break rendering."""
+
+    def load_bytecode(self, bucket: Bucket) -> None:
+        try:
+            super().load_bytecode(bucket)
+        except OSError:
+            pass  # Template gets compiled from source instead
+
+    def dump_bytecode(self, bucket: Bucket) -> None:
+        try:
+            super().dump_bytecode(bucket)
+        except OSError:
+            pass
+
+
+@lru_cache(maxsize=None)
+def _get_bytecode_cache() -> Optional[_BytecodeCache]:
+    """
+    Per-user on-disk cache of compiled templates, so that later runs skip
+    parsing them. Entries are namespaced by version, since the compiled
+    code also depends on the Environment options. None when Jinja finds
+    no safe directory for it.
+    """
+    try:
+        return _BytecodeCache(pattern=f"code_assembler-{__version__}-%s.cache")
+    except (OSError, RuntimeError):
+        return None
+
 
 class MarkdownFormatter:
     """Handles formatting of content into Markdown using Jinja2."""
@@ -35,76 +75,119 @@ class MarkdownFormatter:
             loader=FileSystemLoader(template_dir),
             trim_blocks=True,
             lstrip_blocks=True,
-            keep_trailing_newline=True
+            keep_trailing_newline=True,
+            # Templates ship with the package; don't stat them on every lookup
+            auto_reload=False,
+            bytecode_cache=_get_bytecode_cache()
         )
 
+        # Read the clock once so every timestamp in a document agrees
+        self._timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
         self.env.globals.update({
             "format_number": format_number,
             "format_file_size": format_file_size,
-            "now": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "now": self._timestamp,
             "version": __version__,
             "emoji": EMOJI
         })
 
-    def render(self, template_name: str, data: Dict[str, Any]) -> str:
+        # Compiled templates and their undeclared variables, filled on demand
+        self._templates: Dict[str, Template] = {}
+        self._template_vars: Dict[str, Set[str]] = {}
+
+    def render(self, template_name: str, data: Mapping[str, Any]) -> str:
         """
         Helper to render a template with data.
 
         Args:
             template_name: Name of the .j2 template file.
-            data: Dictionary of variables for the template.
+            data: Variables for the template. Lazy mappings (anything that
+                is not a dict) are only resolved for the names the template
+                actually references.
         """
-        template = self.env.get_template(template_name)
-        return template.render(**data)
+        if not isinstance(data, dict):
+            names = self._get_template_variables(template_name)
+            data = {key: data[key] for key in names if key in data}
+        return "".join(self._generate(template_name, data))
+
+    def _generate(self, template_name: str, data: Dict[str, Any]) -> Iterator[str]:
+        """Yield the rendered pieces of a template."""
+        return self._get_template(template_name).generate(**data)
+
+    def _get_template(self, template_name: str) -> Template:
+        """Return a compiled template, loading it on first use."""
+        template = self._templates.get(template_name)
+        if template is None:
+            template = self._templates[template_name] = self.env.get_template(template_name)
+        return template
+
+    def _get_template_variables(self, template_name: str) -> Set[str]:
+        """Return the undeclared variables referenced by a template."""
+        names = self._template_vars.get(template_name)
+        if names is None:
+            source = self.env.loader.get_source(self.env, template_name)[0]
+            names = meta.find_undeclared_variables(self.env.parse(source))
+            self._template_vars[template_name] = names
+        return names
 
     def _detect_language(self, file_path: str) -> str:
         """
         Detect the programming language for syntax highlighting.
         Checks extensions first, then falls back to exact filenames.
         """
-        path_obj = Path(file_path)
-        ext = path_obj.suffix.lower()
-        filename = path_obj.name.lower()
+        return self._language_for_filename(os.path.basename(file_path))
+
+    @staticmethod
+    def _language_for_filename(basename: str) -> str:
+        """_detect_language for a path already reduced to its basename."""
+        filename = basename.lower()
+        # Same extension as os.path.splitext: leading dots don't start one
+        stem = filename.lstrip('.')
+        dot = stem.rfind('.')
+        ext = stem[dot:] if dot > 0 else ''
 
         # 1. Try by extension
         lang = LANGUAGE_MAP.get(ext, "text")
 
         # 2. Fallback for special filenames if lang is still 'text'
         if lang == "text":
-            if filename == "dockerfile":
-                lang = "dockerfile"
-            elif filename == "makefile":
-                lang = "makefile"
-            elif filename == "procfile":
-                lang = "ruby"
-            elif filename.startswith(".env"):
+            if filename.startswith(".env"):
                 lang = "bash"
-            elif filename == "cmakelists.txt":
-                lang = "cmake"
+            else:
+                lang = _FILENAME_LANGUAGES.get(filename, lang)
 
         return lang
 
     def format_file_block(self, file_path: str, content: str, depth: int = 0,
                           size_bytes: int = 0, line_count: int = 0) -> str:
         """Format a file's content using the file_block template."""
-        lang = self._detect_language(file_path)  # Utilisation de la nouvelle méthode
+        return "".join(self.iter_file_block(file_path, content, depth, size_bytes, line_count))
+
+    def iter_file_block(self, file_path: str, content: str, depth: int = 0,
+                        size_bytes: int = 0, line_count: int = 0) -> Iterator[str]:
+        """
+        Same as format_file_block, but yields the rendered pieces instead of
+        joining them, so a file's content is not copied into a new string.
+        """
+        filename = os.path.basename(file_path)
 
         data = {
             "header_level": "#" * (2 + depth),
-            "filename": Path(file_path).name,
+            "filename": filename,
             "anchor": slugify_path(file_path),
             "path": file_path,
             "size": format_file_size(size_bytes),
             "lines": format_number(line_count),
-            "lang": lang,
+            "lang": self._language_for_filename(filename),
             "content": content
         }
-        return self.render("components/file_block.md.j2", data)
+        return self._generate("components/file_block.md.j2", data)
 
     def format_directory_header(self, dir_path: str, depth: int = 0) -> str:
         """Format a directory header."""
         header_level = "#" * (1 + depth)
-        dirname = Path(dir_path).name
+        dirname = os.path.basename(dir_path)
         return f'{header_level} `{dirname}/`\n\n'
 
     def format_readme_context(self, readme_content: str, depth: int = 0) -> str:
@@ -150,9 +233,9 @@ class MarkdownFormatter:
             largest_file_name = Path(stats.largest_file[0]).name
             largest_file_size = format_file_size(stats.largest_file[1])
 
-        clean_extensions = sorted(list(set(
+        clean_extensions = sorted({
             ext.replace('*', '').lstrip('.') for ext in config.extensions
-        )))
+        })
 
         data = {
             "total_files": format_number(stats.total_files),
@@ -169,10 +252,32 @@ class MarkdownFormatter:
         }
         return self.render("components/stats_table.md.j2", data)
 
-    def generate_header(self, stats: CodebaseStats, config: AssemblerConfig, toc: str, arch_md: str) -> str:
+    def generate_header(
+            self,
+            stats: CodebaseStats,
+            config: AssemblerConfig,
+            toc: str,
+            arch_md: str,
+            delta_summary: str = ""
+    ) -> str:
         """Generate complete document header using the main_header template."""
+        return "".join(self.iter_header(stats, config, toc, arch_md, delta_summary))
+
+    def iter_header(
+            self,
+            stats: CodebaseStats,
+            config: AssemblerConfig,
+            toc: str,
+            arch_md: str,
+            delta_summary: str = ""
+    ) -> Iterator[str]:
+        """
+        Same as generate_header, but yields the rendered pieces so the TOC
+        is not copied into a header string before being written out.
+        """
         data = {
-            "now_short": datetime.now().strftime("%Y-%m-%d %H:%M"),
+            "now_short": self._timestamp[:16],
+            "delta_summary": delta_summary,
             "toc": toc,
             "architecture": arch_md,
             "total_files": format_number(stats.total_files),
@@ -180,7 +285,7 @@ class MarkdownFormatter:
             "skipped_count": len(stats.skipped_files),
             "stats_table": self.generate_stats_table(stats, config)
         }
-        return self.render("main_header.md.j2", data)
+        return self._generate("main_header.md.j2", data)
 
     def generate_metadata_block(self, entries: List[FileEntry]) -> str:
         """
@@ -214,10 +319,10 @@ class MarkdownFormatter:
 
         metadata = {
             "version": __version__,
-            "generated_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "generated_at": self._timestamp,
             "files": meta_files
         }
 
         # Wrap the JSON string in an HTML comment to keep it invisible in UI/Renderers
         # indent=2 makes it readable for debugging in raw text mode
-        return f"\n\n<!-- CODE_ASSEMBLER_METADATA\n{json.dumps(metadata, indent=2)}\n-->"
+        return f"\n\n<!-- CODE_ASSEMBLER_METADATA\n{dumps_json(metadata)}\n-->"
@@ -6,11 +6,68 @@ and running the assembler without memorizing CLI arguments.
 """
 
 import os
-from typing import List, Optional, Dict, Any
+import stat
+import time
+from contextlib import contextmanager
+from typing import Iterator, List, Optional, Dict, Any, Tuple
 
 from .constants import LANGUAGE_MAP, DEFAULT_EXCLUDE_PATTERNS, EMOJI
 from .core import assemble_codebase
 
+# Directory listings behind path completion are reused for this many
+# seconds, so repeated TAB presses don't rescan (possibly remote) folders
+_COMPLETION_TTL = 1.0
+_listing_cache: Dict[str, Tuple[float, List[str]]] = {}
+
+
+def _list_completions(directory: str) -> List[str]:
+    """Sorted entry names of a directory, with a '/' after subdirectories."""
+    now = time.monotonic()
+    cached = _listing_cache.get(directory)
+    if cached is not None and now - cached[0] < _COMPLETION_TTL:
+        return cached[1]
+    try:
+        with os.scandir(directory or ".") as entries:
+            names = sorted(e.name + "/" if e.is_dir() else e.name for e in entries)
+    except OSError:
+        names = []
+    _listing_cache[directory] = (now, names)
+    return names
+
+
+def _complete_path(text: str, state: int) -> Optional[str]:
+    """readline completer: the state-th path starting with the typed text."""
+    directory, prefix = os.path.split(text)
+    matches = [
+        os.path.join(directory, name)
+        for name in _list_completions(directory) if name.startswith(prefix)
+    ]
+    return matches[state] if state < len(matches) else None
+
+
+@contextmanager
+def _path_completion() -> Iterator[None]:
+    """TAB-complete paths in input() while active, where readline exists."""
+    try:
+        import readline
+    except ImportError:  # e.g. Windows without pyreadline
+        yield
+        return
+
+    old_completer = readline.get_completer()
+    old_delims = readline.get_completer_delims()
+    readline.set_completer(_complete_path)
+    readline.set_completer_delims("\t\n")  # Paths may contain spaces
+    if "libedit" in (readline.__doc__ or ""):
+        readline.parse_and_bind("bind ^I rl_complete")
+    else:
+        readline.parse_and_bind("tab: complete")
+    try:
+        yield
+    finally:
+        readline.set_completer(old_completer)
+        readline.set_completer_delims(old_delims)
+
 
 class InteractiveWizard:
     """Interactive configuration wizard for Code Assembler Pro."""
@@ -20,7 +77,8 @@ class InteractiveWizard:
         self.available_extensions = self._get_available_extensions()
 
     def _get_available_extensions(self) -> List[str]:
-        return sorted(list(set(LANGUAGE_MAP.keys())))
+        # Dict keys are already unique
+        return sorted(LANGUAGE_MAP)
 
     def _print_banner(self):
         print("\n" + "=" * 70)
@@ -83,30 +141,34 @@ class InteractiveWizard:
 
         elif choice == "2":
             print("\nEnter directory paths (one per line, empty line to finish):")
-            while True:
-                path = input("  Path: ").strip()
-                if not path:
-                    break
-                if os.path.exists(path):
-                    if os.path.isdir(path):
+            with _path_completion():
+                while True:
+                    path = input("  Path: ").strip()
+                    if not path:
+                        break
+                    try:
+                        is_dir = stat.S_ISDIR(os.stat(path).st_mode)
+                    except (OSError, ValueError):
+                        print(f"  {EMOJI['warning']}  '{path}' does not exist")
+                        continue
+                    if is_dir:
                         paths.append(path)
                         print(f"  {EMOJI['success']} Added: {path}")
                     else:
                         print(f"  {EMOJI['warning']}  '{path}' is not a directory")
-                else:
-                    print(f"  {EMOJI['warning']}  '{path}' does not exist")
 
         elif choice == "3":
             print("\nEnter file paths (one per line, empty line to finish):")
-            while True:
-                path = input("  File: ").strip()
-                if not path:
-                    break
-                if os.path.exists(path) and os.path.isfile(path):
-                    paths.append(path)
-                    print(f"  {EMOJI['success']} Added: {path}")
-                else:
-                    print(f"  {EMOJI['warning']}  '{path}' is not a valid file")
+            with _path_completion():
+                while True:
+                    path = input("  File: ").strip()
+                    if not path:
+                        break
+                    if os.path.isfile(path):
+                        paths.append(path)
+                        print(f"  {EMOJI['success']} Added: {path}")
+                    else:
+                        print(f"  {EMOJI['warning']}  '{path}' is not a valid file")
 
         if not paths:
             print(f"{EMOJI['warning']}  No paths selected, using current directory")
@@ -190,7 +252,7 @@ class InteractiveWizard:
                 print(f"  {EMOJI['success']} Added: {pattern}")
 
         if use_defaults:
-            return list(set(DEFAULT_EXCLUDE_PATTERNS + custom_patterns))
+            return list(dict.fromkeys([*DEFAULT_EXCLUDE_PATTERNS, *custom_patterns]))
         return custom_patterns
 
     def _configure_output(self) -> str:
@@ -203,8 +265,15 @@ class InteractiveWizard:
             if not self._ask_yes_no(
                 f"{EMOJI['warning']}  '{output}' already exists. Overwrite?", default=False
             ):
+                # One listing instead of a stat per candidate; names are
+                # lowercased so case-insensitive filesystems are covered
+                try:
+                    taken = {name.lower() for name in os.listdir('.')}
+                    is_taken = taken.__contains__
+                except OSError:
+                    is_taken = os.path.exists
                 counter = 1
-                while os.path.exists(f"codebase_{counter}.md"):
+                while is_taken(f"codebase_{counter}.md"):
                     counter += 1
                 output = f"codebase_{counter}.md"
                 print(f"{EMOJI['success']} Using: {output}")
@@ -269,14 +338,13 @@ class InteractiveWizard:
         if self._ask_yes_no(
             f"\n{EMOJI['floppy']} Save this configuration for future use?", default=False
         ):
-            import json
+            from .file_io import dump_json_file
             config_name = self._ask_text("Configuration filename", default="assembler_config.json")
             if not config_name.endswith('.json'):
                 config_name += '.json'
 
             save_config = {k: v for k, v in self.config.items() if k != 'show_progress'}
-            with open(config_name, 'w', encoding='utf-8') as f:
-                json.dump(save_config, f, indent=2, ensure_ascii=False)
+            dump_json_file(config_name, save_config)
 
             print(f"{EMOJI['success']} Configuration saved to: {config_name}")
             print(f"   Reuse it with: code-assembler --config {config_name}")
@@ -6,10 +6,58 @@ from a generated Markdown snapshot, using the embedded JSON metadata.
 """
 
 import json
+import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
+from .file_io import loads_json
+
+# The snapshot is parsed as UTF-8 bytes: decoding it whole would cost a
+# full pass and, with the emoji in its header, up to 4 bytes per character
+_METADATA_RE = re.compile(rb'<!-- CODE_ASSEMBLER_METADATA\s+(.*?)\s+-->', re.DOTALL)
+_METADATA_MARKER = b'<!-- CODE_ASSEMBLER_METADATA'
+_HEADER_RE = re.compile(
+    rb'#+ `([^`]+)`[ \t]*\r?\n(?:[ \t]*\r?\n)?```[a-z0-9]*\r?\n',
+    re.IGNORECASE
+)
+_CLOSING_FENCE_RE = re.compile(rb'\r?\n```[ \t]*(?:\r?\n|$)')
+
+# File writes are latency-bound and release the GIL, so oversubscribe the CPUs
+_WRITE_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+# Keeps Windows from translating line endings on raw descriptors
+_O_BINARY = getattr(os, "O_BINARY", 0)
+_LINESEP = os.linesep.encode('ascii')
+
+
+def _escapes_output_dir(rel_path: str) -> bool:
+    """
+    Lexically check whether a metadata path could resolve outside the
+    output directory: absolute or drive-anchored, or with a '..' segment
+    under either separator style. Names merely containing '..' are fine.
+    """
+    if rel_path.startswith(("/", "\\")) or Path(rel_path).anchor:
+        return True
+    return ".." in rel_path.replace("\\", "/").split("/")
+
+
+def _write_text_file(path: Path, content: bytes) -> None:
+    """
+    Write UTF-8 content with the platform's line endings, like
+    Path.write_text, through a raw file descriptor: for the many small files
+    of a rebuild the buffered text-layer setup costs more than the write.
+    """
+    if _LINESEP != b"\n":
+        content = content.replace(b"\n", _LINESEP)
+    data = memoryview(content)
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | _O_BINARY, 0o666)
+    try:
+        while data:
+            data = data[os.write(fd, data):]
+    finally:
+        os.close(fd)
+
 
 class CodebaseRebuilder:
     """Handles the reconstruction of files from a Markdown codebase."""
@@ -19,24 +67,38 @@ class CodebaseRebuilder:
         self.output_dir = Path(output_dir)
         self.dry_run = dry_run
         self.metadata: Dict = {}
-        self.md_content: str = ""
+        self.md_content: bytes = b""
+        # Header scan of md_content, built on first lookup: the header list
+        # plus the index of each path's first header in it
+        self._headers: Optional[List[Tuple[str, int, int]]] = None
+        self._header_index: Dict[str, int] = {}
 
     def _extract_metadata(self) -> bool:
         """Extract the hidden JSON metadata from the Markdown file."""
         if not self.md_path.exists():
             return False
 
-        self.md_content = self.md_path.read_text(encoding='utf-8')
-        pattern = re.compile(r'<!-- CODE_ASSEMBLER_METADATA\s+(.*?)\s+-->', re.DOTALL)
-        match = pattern.search(self.md_content)
+        self.md_content = self.md_path.read_bytes()
+        if b"\r" in self.md_content:
+            # Universal newlines, as read_text would apply them: snapshots
+            # written on Windows have CRLF line endings
+            self.md_content = self.md_content.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+        self._headers = None
+        # The block is appended at the very end: look for the last marker
+        # instead of scanning the whole document (whose files may quote the
+        # marker themselves), falling back to a full scan if it is malformed
+        pos = self.md_content.rfind(_METADATA_MARKER)
+        match = _METADATA_RE.match(self.md_content, pos) if pos != -1 else None
+        if pos != -1 and not match:
+            match = _METADATA_RE.search(self.md_content)
 
         if not match:
             return False
 
         try:
-            self.metadata = json.loads(match.group(1))
+            self.metadata = loads_json(match.group(1))
             return True
-        except json.JSONDecodeError:
+        except (json.JSONDecodeError, UnicodeDecodeError):
             return False
 
     def _find_real_file_headers(self) -> List[Tuple[str, int, int]]:
@@ -62,18 +124,15 @@ class CodebaseRebuilder:
         content and to bound where each block ends (the next entry's start
         is the bound for the previous one).
         """
-        header_re = re.compile(
-            r'#+ `([^`]+)`[ \t]*\r?\n(?:[ \t]*\r?\n)?```[a-z0-9]*\r?\n',
-            re.IGNORECASE
-        )
         return [
-            (m.group(1).strip().replace('\\', '/'), m.start(), m.end())
-            for m in header_re.finditer(self.md_content)
+            (m.group(1).decode('utf-8', 'replace').strip().replace('\\', '/'),
+             m.start(), m.end())
+            for m in _HEADER_RE.finditer(self.md_content)
         ]
 
-    def _extract_file_content(self, rel_path: str) -> Optional[str]:
+    def _extract_file_content(self, rel_path: str) -> Optional[bytes]:
         """
-        Find and extract the content of a specific file from the Markdown.
+        Find and extract the UTF-8 content of a specific file from the Markdown.
         Robust against path separators, blank lines, duplicate filenames at
         different paths, and nested ``` fences inside the file's own content
         (a markdown file documenting code blocks, a README showing
@@ -81,12 +140,14 @@ class CodebaseRebuilder:
         validated scan is used instead of a per-call regex search).
         """
         target_normalized = rel_path.replace('\\', '/').strip()
-        headers = self._find_real_file_headers()
+        headers = self._headers
+        if headers is None:
+            headers = self._headers = self._find_real_file_headers()
+            self._header_index = {}
+            for i, (path, _, _) in enumerate(headers):
+                self._header_index.setdefault(path, i)
 
-        match_index = next(
-            (i for i, (path, _, _) in enumerate(headers) if path == target_normalized),
-            None
-        )
+        match_index = self._header_index.get(target_normalized)
         if match_index is None:
             return None
 
@@ -94,17 +155,50 @@ class CodebaseRebuilder:
         content_end_bound = (
             headers[match_index + 1][1] if match_index + 1 < len(headers) else len(self.md_content)
         )
-        search_zone = self.md_content[content_start:content_end_bound]
 
         # True closing fence = the LAST bare ``` line in the window, since
         # earlier ones may be nested fences belonging to the file's own
-        # content rather than the block's real terminator.
-        closing_candidates = list(re.finditer(r'\r?\n```[ \t]*(?:\r?\n|$)', search_zone))
-        if not closing_candidates:
+        # content rather than the block's real terminator. The window is
+        # searched in place (endpos acts as the end of the string for '$')
+        # so only the extracted content gets copied.
+        last_closing = None
+        for last_closing in _CLOSING_FENCE_RE.finditer(
+                self.md_content, content_start, content_end_bound):
+            pass
+        if last_closing is None:
             return None
 
-        last_closing = closing_candidates[-1]
-        return search_zone[:last_closing.start()]
+        return self.md_content[content_start:last_closing.start()]
+
+    @staticmethod
+    def _write_target(
+            target_path: Path,
+            entries: List[Tuple[str, bytes, List[str]]],
+            dir_error: Optional[Exception]
+    ) -> int:
+        """
+        Write the entries extracted for one target file, recording failures
+        and truncation warnings in each entry's report.
+
+        Returns:
+            int: number of entries written
+        """
+        written = 0
+        for rel_path, content, report in entries:
+            if dir_error is not None:
+                report.append(f"Failed to write {rel_path}: {str(dir_error)}")
+                continue
+            try:
+                _write_text_file(target_path, content)
+
+                # Check for truncation warning
+                if b"[TRUNCATED]" in content:
+                    report.append(f"Warning: {rel_path} was truncated in the source MD.")
+
+                written += 1
+            except Exception as e:
+                report.append(f"Failed to write {rel_path}: {str(e)}")
+        return written
 
     def rebuild(self) -> Tuple[int, List[str]]:
         """
@@ -118,7 +212,12 @@ class CodebaseRebuilder:
 
         files_to_rebuild = self.metadata.get("files", {})
         created_count = 0
-        errors = []
+        # One message list per file, so messages from the threaded writes
+        # come back in metadata order
+        reports: List[List[str]] = []
+        # Target -> its (rel_path, content, report) entries: entries sharing
+        # a target are written in order by the same worker
+        writes: Dict[Path, List[Tuple[str, bytes, List[str]]]] = {}
 
         if not self.dry_run:
             self.output_dir.mkdir(parents=True, exist_ok=True)
@@ -127,12 +226,12 @@ class CodebaseRebuilder:
             content = self._extract_file_content(rel_path)
 
             if content is None:
-                errors.append(f"Content not found for: {rel_path}")
+                reports.append([f"Content not found for: {rel_path}"])
                 continue
 
             # Security: Prevent path traversal
-            if ".." in rel_path or rel_path.startswith("/") or rel_path.startswith("\\"):
-                errors.append(f"Security skip (invalid path): {rel_path}")
+            if _escapes_output_dir(rel_path):
+                reports.append([f"Security skip (invalid path): {rel_path}"])
                 continue
 
             target_path = self.output_dir / rel_path
@@ -142,16 +241,26 @@ class CodebaseRebuilder:
                 created_count += 1
                 continue
 
-            try:
-                target_path.parent.mkdir(parents=True, exist_ok=True)
-                target_path.write_text(content, encoding='utf-8')
+            report: List[str] = []
+            reports.append(report)
+            writes.setdefault(target_path, []).append((rel_path, content, report))
 
-                # Check for truncation warning
-                if "[TRUNCATED]" in content:
-                    errors.append(f"Warning: {rel_path} was truncated in the source MD.")
+        if writes:
+            # Each parent directory is created once, before any write needs it
+            dir_errors: Dict[Path, Exception] = {}
+            for parent in dict.fromkeys(target.parent for target in writes):
+                try:
+                    parent.mkdir(parents=True, exist_ok=True)
+                except Exception as e:
+                    dir_errors[parent] = e
 
-                created_count += 1
-            except Exception as e:
-                errors.append(f"Failed to write {rel_path}: {str(e)}")
+            with ThreadPoolExecutor(max_workers=_WRITE_WORKERS) as executor:
+                created_count += sum(executor.map(
+                    self._write_target,
+                    writes,
+                    writes.values(),
+                    [dir_errors.get(target.parent) for target in writes]
+                ))
 
+        errors = [message for report in reports for message in report]
         return created_count, errors
\ No newline at end of file
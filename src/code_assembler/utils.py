@@ -5,12 +5,13 @@ This module provides helper functions for path normalization,
 string formatting, clipboard operations, and other common tasks.
 """
 
+import os
 import re
 import fnmatch
 import subprocess
 import platform
-from pathlib import Path, PurePosixPath
-from typing import List
+from functools import lru_cache
+from typing import List, Optional, Pattern, Tuple
 
 from .constants import CHARS_PER_TOKEN
 
@@ -18,6 +19,22 @@ from .constants import CHARS_PER_TOKEN
 # Prevents infinite blocking if a clipboard manager hangs.
 _CLIPBOARD_TIMEOUT = 10
 
+# fnmatch.translate() wraps its output as '(?s:...)\\Z'
+_FNMATCH_WRAPPER = re.compile(r'\(\?s:(.*)\)\\[Zz]', re.DOTALL)
+
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+_SIZE_DIVISORS = tuple(1 << (10 * i) for i in range(len(_SIZE_UNITS)))
+
+# Line boundaries recognised by str.splitlines besides '\n'
+_OTHER_LINE_BREAKS = ('\r', '\v', '\f', '\x1c', '\x1d', '\x1e', '\x85', '\u2028', '\u2029')
+
+# slugify_path for ASCII input: alphanumerics lowercased, anything else '_'
+_SLUG_NON_ALNUM = re.compile(r'[^a-zA-Z0-9]')
+_SLUG_TABLE = {
+    i: chr(i).lower() if chr(i).isalnum() else '_'
+    for i in range(128)
+}
+
 
 def normalize_path(path: str) -> str:
     """
@@ -26,22 +43,65 @@ def normalize_path(path: str) -> str:
     """
     if not path:
         return ""
-    return str(PurePosixPath(path)).replace("\\", "/").lower().rstrip("/")
+    if "//" in path or "/./" in path or path.startswith("./") or path.endswith("/."):
+        # Lexical cleanup as PurePosixPath does it: empty and '.' segments
+        # go, '..' stays, and exactly two leading slashes are kept (POSIX)
+        root = "/" if path.startswith("/") else ""
+        if path.startswith("//") and not path.startswith("///"):
+            root = "//"
+        path = root + "/".join(seg for seg in path.split("/") if seg and seg != ".") or "."
+    return path.replace("\\", "/").lower().rstrip("/")
 
 
 def slugify_path(path: str) -> str:
     """Convert a file path to a valid HTML anchor identifier."""
-    return re.sub(r'[^a-zA-Z0-9]', '_', path).lower()
-
-
-def should_exclude(path: str, exclude_patterns: List[str]) -> bool:
-    """Determine if a path should be excluded based on patterns."""
-    if not exclude_patterns:
-        return False
+    if path.isascii():
+        return path.translate(_SLUG_TABLE)
+    return _SLUG_NON_ALNUM.sub('_', path).lower()
 
-    path_norm = normalize_path(path)
-    path_parts: List[str] = [p for p in path_norm.split("/") if p]
 
+def _glob_to_segment_regex(pattern: str) -> str:
+    """
+    Translate a glob pattern into a regex confined to a single path segment.
+    Same syntax as fnmatch, except that wildcards never match '/'.
+    """
+    i, n = 0, len(pattern)
+    out: List[str] = []
+    while i < n:
+        c = pattern[i]
+        i += 1
+        if c == '*':
+            out.append('[^/]*')
+        elif c == '?':
+            out.append('[^/]')
+        elif c == '[':
+            j = i
+            if j < n and pattern[j] == '!':
+                j += 1
+            if j < n and pattern[j] == ']':
+                j += 1
+            j = pattern.find(']', j)
+            if j == -1:
+                out.append('\\[')
+                continue
+            # Let fnmatch parse the bracket expression (ranges, escaping)
+            bracket = _FNMATCH_WRAPPER.fullmatch(fnmatch.translate(pattern[i - 1:j + 1])).group(1)
+            i = j + 1
+            if bracket == '.':
+                bracket = '[^/]'
+            elif bracket.startswith('[^'):
+                bracket = '[^/' + bracket[2:]
+            out.append(bracket)
+        else:
+            out.append(re.escape(c))
+    return ''.join(out)
+
+
+def _exclude_alternatives(exclude_patterns: List[str]) -> Tuple[List[str], List[str]]:
+    """Translate exclusion patterns into (segment, path) regex alternatives."""
+    segments: List[str] = []
+    suffixes: List[str] = []
+    paths: List[str] = []
     for pattern in exclude_patterns:
         if not pattern:
             continue
@@ -50,22 +110,95 @@ def should_exclude(path: str, exclude_patterns: List[str]) -> bool:
 
         if "/" in clean_pattern or "\\" in clean_pattern:
             pattern_norm = normalize_path(clean_pattern)
-            if path_norm == pattern_norm:
-                return True
-            if ("/" + pattern_norm + "/") in ("/" + path_norm + "/"):
-                return True
+            if pattern_norm:
+                paths.append(re.escape(pattern_norm))
             continue
 
-        for part in path_parts:
-            if part == clean_pattern:
-                return True
-            if "*" in clean_pattern or "?" in clean_pattern:
-                if fnmatch.fnmatch(part, clean_pattern):
-                    return True
-            if clean_pattern.startswith(".") and part.endswith(clean_pattern):
-                return True
+        if "*" in clean_pattern or "?" in clean_pattern:
+            segments.append(_glob_to_segment_regex(clean_pattern))
+        elif not clean_pattern.startswith("."):
+            segments.append(re.escape(clean_pattern))
+        if clean_pattern.startswith("."):
+            suffixes.append(re.escape(clean_pattern))
+    if suffixes:
+        # One '[^/]*' shared by all suffixes ('.pyc', '.so', ...) instead of
+        # one per pattern, each backtracking over the whole segment
+        segments.append('[^/]*(?:' + '|'.join(suffixes) + ')')
+    return segments, paths
+
+
+def _compile_alternatives(segments: List[str], paths: List[str]) -> Optional[Pattern[str]]:
+    alternatives = paths
+    if segments:
+        # Segment patterns never match the empty segment of a leading '/'
+        alternatives = ['(?=[^/])(?:' + '|'.join(segments) + ')'] + paths
+    if not alternatives:
+        return None
+    return re.compile('(?:^|/)(?:' + '|'.join(alternatives) + ')(?:/|$)')
+
+
+def compile_exclude_patterns(exclude_patterns: List[str]) -> Optional[Pattern[str]]:
+    """
+    Compile exclusion patterns into a single regex over normalized paths.
+
+    Patterns without a separator match whole path segments: exactly, as a
+    glob when they contain '*' or '?', or as a suffix when they start with
+    '.' (e.g. '.pyc'). Patterns with a separator match a run of whole
+    segments. Returns None when there is nothing to exclude.
+    """
+    return _compile_alternatives(*_exclude_alternatives(exclude_patterns))
+
+
+@lru_cache(maxsize=32)
+def _compile_exclude_tuple(exclude_patterns: Tuple[str, ...]) -> Optional[Pattern[str]]:
+    """compile_exclude_patterns, memoized for callers passing raw pattern lists."""
+    return compile_exclude_patterns(list(exclude_patterns))
+
 
-    return False
+def split_exclude_patterns(
+        exclude_patterns: List[str]
+) -> Tuple[Optional[Pattern[str]], Optional[Pattern[str]]]:
+    """
+    Compile exclusion patterns as two regexes: one for the patterns matching
+    single segments and one for those with a separator (None when empty).
+
+    During a walk whose directories already passed the check, the segment
+    regex only needs to see an entry's own name (normalized like a path),
+    and only the path regex needs the full path.
+    """
+    segments, paths = _exclude_alternatives(exclude_patterns)
+    return _compile_alternatives(segments, []), _compile_alternatives([], paths)
+
+
+def is_excluded(path: str, exclude_re: Optional[Pattern[str]]) -> bool:
+    """Check a path against patterns compiled by compile_exclude_patterns."""
+    if exclude_re is None:
+        return False
+    return exclude_re.search(normalize_path(path)) is not None
+
+
+def is_excluded_entry(
+        entry: os.DirEntry,
+        name_re: Optional[Pattern[str]],
+        path_re: Optional[Pattern[str]]
+) -> bool:
+    """
+    Check a directory entry against the regexes of split_exclude_patterns.
+
+    The entry's parent directory must already have passed the exclusion
+    check: segment patterns then only need to see the entry's own name,
+    and only patterns with a separator are matched against its full path.
+    """
+    if name_re is not None and name_re.search(entry.name.replace("\\", "/").lower()):
+        return True
+    return path_re is not None and path_re.search(normalize_path(entry.path)) is not None
+
+
+def should_exclude(path: str, exclude_patterns: List[str]) -> bool:
+    """Determine if a path should be excluded based on patterns."""
+    if not exclude_patterns:
+        return False
+    return is_excluded(path, _compile_exclude_tuple(tuple(exclude_patterns)))
 
 
 def estimate_tokens(text: str) -> int:
@@ -75,29 +208,36 @@ def estimate_tokens(text: str) -> int:
 
 def format_file_size(size_bytes: int) -> str:
     """Format a file size in human-readable format."""
-    if size_bytes == 0:
-        return "0B"
-    size = float(size_bytes)
-    for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-        if size < 1024.0:
-            return f"{size:.1f}{unit}" if unit != 'B' else f"{int(size)}{unit}"
-        size /= 1024.0
-    return f"{size:.1f}PB"
+    if size_bytes < 1024:
+        return f"{int(size_bytes)}B"
+    # Each unit is 2**10 of the previous one, so the bit length picks it
+    index = (int(size_bytes).bit_length() - 1) // 10
+    if index > 5:
+        index = 5
+    return f"{size_bytes / _SIZE_DIVISORS[index]:.1f}{_SIZE_UNITS[index]}"
 
 
 def format_number(num: int) -> str:
     """Format a number with thousands separators."""
+    if -1000 < num < 1000:
+        return str(num)  # No separator needed; str() is cheaper
     return f"{num:,}"
 
 
 def get_file_extension(path: str) -> str:
     """Get the file extension from a path."""
-    return Path(path).suffix
+    # Same rule as Path.suffix, without building a Path per file
+    name = os.path.basename(path)
+    i = name.rfind('.')
+    return name[i:] if 0 < i < len(name) - 1 else ''
 
 
 def count_lines(text: str) -> int:
     """Count the number of lines in a text."""
-    return len(text.splitlines())
+    if any(sep in text for sep in _OTHER_LINE_BREAKS):
+        return len(text.splitlines())
+    # Same count as splitlines without building the list of lines
+    return text.count('\n') + (not text.endswith('\n') if text else 0)
 
 
 def copy_to_clipboard(text: str) -> bool:
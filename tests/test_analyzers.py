@@ -0,0 +1,129 @@
+"""
+Tests for the architecture analyzer.
+"""
+import os
+import sys
+import unittest
+from unittest.mock import patch
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from code_assembler.analyzers import ArchitectureAnalyzer
+from code_assembler.config import FileEntry, CodebaseStats
+
+
+def _p(*parts: str) -> str:
+    """Build a native absolute path from components."""
+    return os.sep + os.sep.join(parts)
+
+
+class TestComponents(unittest.TestCase):
+
+    def test_components_count_files_per_top_level_dir(self):
+        """Each top-level directory under the common root is counted once per file."""
+        entries = [
+            FileEntry(path=_p("proj", "api"), type="dir", depth=0),
+            FileEntry(path=_p("proj", "api", "routes.py"), type="file", depth=1),
+            FileEntry(path=_p("proj", "api", "v1", "users.py"), type="file", depth=2),
+            FileEntry(path=_p("proj", "db"), type="dir", depth=0),
+            FileEntry(path=_p("proj", "db", "models.py"), type="file", depth=1),
+            FileEntry(path=_p("proj", "main.py"), type="file", depth=0),
+        ]
+        analyzer = ArchitectureAnalyzer(entries, CodebaseStats())
+
+        self.assertEqual(
+            analyzer._get_components(),
+            [{"name": "api", "count": 2}, {"name": "db", "count": 1}]
+        )
+
+    def test_components_ignore_same_name_deeper_in_tree(self):
+        """A nested directory sharing a top-level name must not inflate its count."""
+        entries = [
+            FileEntry(path=_p("proj", "core", "a.py"), type="file", depth=1),
+            FileEntry(path=_p("proj", "lib", "core", "b.py"), type="file", depth=2),
+        ]
+        analyzer = ArchitectureAnalyzer(entries, CodebaseStats())
+
+        self.assertEqual(
+            analyzer._get_components(),
+            [{"name": "core", "count": 1}, {"name": "lib", "count": 1}]
+        )
+
+    def test_components_below_single_subdirectory(self):
+        """A root holding one directory entry lists the components inside it."""
+        entries = [
+            FileEntry(path=_p("proj", "pkg"), type="dir", depth=0),
+            FileEntry(path=_p("proj", "pkg", "__init__.py"), type="file", depth=1),
+            FileEntry(path=_p("proj", "pkg", "core"), type="dir", depth=1),
+            FileEntry(path=_p("proj", "pkg", "core", "a.py"), type="file", depth=2),
+            FileEntry(path=_p("proj", "pkg", "util"), type="dir", depth=1),
+            FileEntry(path=_p("proj", "pkg", "util", "b.py"), type="file", depth=2),
+            FileEntry(path=_p("proj", "pkg", "util", "c.py"), type="file", depth=2),
+        ]
+        analyzer = ArchitectureAnalyzer(entries, CodebaseStats())
+
+        self.assertEqual(
+            analyzer._get_components(),
+            [{"name": "core", "count": 1}, {"name": "util", "count": 2}]
+        )
+
+    def test_components_single_file(self):
+        """A lone file has no component."""
+        entries = [FileEntry(path=_p("proj", "main.py"), type="file", depth=0)]
+        analyzer = ArchitectureAnalyzer(entries, CodebaseStats())
+        self.assertEqual(analyzer._get_components(), [])
+
+
+class TestPatterns(unittest.TestCase):
+
+    def test_patterns_detected_across_directories(self):
+        """Indicators may be spread over different directories."""
+        entries = [
+            FileEntry(path=_p("proj", "app", "models.py"), type="file", depth=1),
+            FileEntry(path=_p("proj", "tests", "test_app.py"), type="file", depth=1),
+            FileEntry(path=_p("proj", "pyproject.toml"), type="file", depth=0),
+        ]
+        analyzer = ArchitectureAnalyzer(entries, CodebaseStats())
+
+        self.assertEqual(analyzer._get_patterns(), [
+            "Centralized configuration files",
+            "Organized test structure",
+            "Persistence/Database layer",
+        ])
+
+    def test_patterns_ignore_directory_entries(self):
+        """Directory names never trigger a pattern on their own."""
+        entries = [FileEntry(path=_p("proj", "test_data"), type="dir", depth=0)]
+        analyzer = ArchitectureAnalyzer(entries, CodebaseStats())
+        self.assertEqual(analyzer._get_patterns(), [])
+
+
+class TestAnalysisView(unittest.TestCase):
+
+    def test_fields_are_computed_on_access(self):
+        """Only the fields that are read trigger their analysis pass."""
+        entries = [FileEntry(path=_p("proj", "app", "models.py"), type="file", depth=1)]
+        stats = CodebaseStats(total_files=1, files_by_ext={".py": 1})
+        analyzer = ArchitectureAnalyzer(entries, stats)
+        view = analyzer.analyze_data()
+
+        with patch.object(
+                analyzer, "_get_patterns", wraps=analyzer._get_patterns) as patterns:
+            self.assertEqual(view["distribution"][0]["ext"], ".py")
+            self.assertIn("patterns", view)
+            patterns.assert_not_called()
+            self.assertEqual(view["patterns"], ["Persistence/Database layer"])
+            self.assertEqual(view["patterns"], ["Persistence/Database layer"])
+            patterns.assert_called_once()
+
+    def test_max_depth_synced_from_depth_distribution(self):
+        entries = [FileEntry(path=_p("proj", "a", "b", "c.py"), type="file", depth=2)]
+        view = ArchitectureAnalyzer(entries, CodebaseStats()).analyze_data()
+        self.assertEqual(view["max_depth"], 2)
+        self.assertEqual(dict(view)["depth_distribution"], {2: 1})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -59,7 +59,8 @@ class TestClipboard(unittest.TestCase):
             )
 
     @patch('code_assembler.cli.parse_args')
-    @patch('code_assembler.cli.assemble_codebase')
+    # core is imported lazily inside main(), so patch it at its source
+    @patch('code_assembler.core.assemble_codebase')
     @patch('code_assembler.utils.copy_to_clipboard')
     def test_cli_calls_clipboard(self, mock_copy, mock_assemble, mock_parse):
         """Test that CLI triggers clipboard copy when --clip is set."""
@@ -82,7 +83,8 @@ class TestClipboard(unittest.TestCase):
             max_size=10.0,
             since=None,
             compress=False,
-            compress_level="signatures"
+            compress_level="signatures",
+            cache_dir=None
         )
         mock_parse.return_value = args
 
@@ -1,6 +1,7 @@
 """
 Tests for configuration module.
 """
+import os
 import sys
 import unittest
 from pathlib import Path
@@ -8,7 +9,8 @@ from pathlib import Path
 # Add src to path
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
 
-from code_assembler.config import AssemblerConfig
+from code_assembler.config import AssemblerConfig, FileEntry
+from code_assembler.constants import DEFAULT_EXCLUDE_PATTERNS
 
 
 class TestExtensionClassification(unittest.TestCase):
@@ -78,5 +80,38 @@ class TestExtensionClassification(unittest.TestCase):
         self.assertIn("Makefile", config.exact_filenames)
 
 
+class TestDefaultExcludes(unittest.TestCase):
+    """Test the merge of user and default exclusion patterns."""
+
+    def test_merge_is_deduplicated_and_ordered(self):
+        """User patterns come first, defaults follow, duplicates are dropped."""
+        config = AssemblerConfig(
+            paths=["."], extensions=["py"], exclude_patterns=["tests", "dist"]
+        )
+        self.assertEqual(config.exclude_patterns[:2], ["tests", "dist"])
+        self.assertEqual(
+            config.exclude_patterns[2:],
+            [p for p in DEFAULT_EXCLUDE_PATTERNS if p != "dist"]
+        )
+
+    def test_is_excluded_uses_merged_patterns(self):
+        """User and default patterns both exclude; other paths are kept."""
+        config = AssemblerConfig(paths=["."], extensions=["py"], exclude_patterns=["*.log"])
+        self.assertTrue(config.is_excluded("proj/debug.log"))
+        self.assertTrue(config.is_excluded("proj/node_modules/pkg/index.js"))
+        self.assertFalse(config.is_excluded("proj/src/main.py"))
+        self.assertIs(config.exclude_regex, config.exclude_regex)
+
+
+class TestFileEntry(unittest.TestCase):
+
+    def test_name_matches_path_name(self):
+        """Entry names agree with Path.name, whatever the path's shape."""
+        for path in ("main.py", os.path.join("src", "main.py"), "src/main.py",
+                     os.path.join("src", "pkg", ""), os.sep + "abs" + os.sep + "x.md"):
+            self.assertEqual(FileEntry(path=path, type="file", depth=0).name,
+                             Path(path).name, path)
+
+
 if __name__ == "__main__":
     unittest.main()
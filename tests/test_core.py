@@ -1,4 +1,5 @@
 import json
+import os
 import shutil
 import sys
 import tempfile
@@ -80,6 +81,27 @@ class TestCore(unittest.TestCase):
         self.assertIn("main.py", result)
         self.assertNotIn("test_main.py", result, "The 'tests' directory should have been excluded")
 
+    def test_extension_and_filename_matching(self):
+        """Multi-dot extensions and exact filenames are matched, case-sensitively."""
+        src_dir = self.root / "project"
+        src_dir.mkdir()
+        for name in ("app.py", "base.env.j2", "Dockerfile", "notes.txt", "UPPER.PY", "dockerfile"):
+            (src_dir / name).write_text("x = 1", encoding='utf-8')
+
+        output_file = self.root / "output.md"
+        assemble_codebase(
+            paths=[str(src_dir)],
+            extensions=["py", ".env.j2", "Dockerfile"],
+            output=str(output_file),
+            show_progress=False
+        )
+
+        result = output_file.read_text(encoding='utf-8')
+        for name in ("app.py", "base.env.j2", "Dockerfile"):
+            self.assertIn(f"- `{name}`", result)
+        for name in ("notes.txt", "UPPER.PY", "dockerfile"):
+            self.assertNotIn(f"- `{name}`", result)
+
     def test_json_config_loading(self):
         """Test loading configuration from a JSON file and the output_file mapping."""
         src_dir = self.root / "src"
@@ -104,6 +126,239 @@ class TestCore(unittest.TestCase):
 
         self.assertTrue(output_md.exists(), "Output file defined in JSON was not created")
 
+    def test_config_cache_invalidated_on_edit(self):
+        """Repeated loads reuse the parse; editing the file invalidates it."""
+        from code_assembler.core import _load_config, _load_config_cached
+
+        config_file = self.root / "config.json"
+        config_file.write_text(json.dumps({"paths": ["a"]}), encoding='utf-8')
+        _load_config_cached.cache_clear()
+
+        first = _load_config(str(config_file))
+        first["paths"].append("mutated")
+        self.assertEqual(_load_config(str(config_file)), {"paths": ["a"]})
+        self.assertEqual(_load_config_cached.cache_info().hits, 1)
+
+        config_file.write_text(json.dumps({"paths": ["b"]}), encoding='utf-8')
+        stat = config_file.stat()
+        os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        self.assertEqual(_load_config(str(config_file)), {"paths": ["b"]})
+
+        # Same mtime but a different size still counts as an edit
+        stat = config_file.stat()
+        config_file.write_text(json.dumps({"paths": ["cc"]}), encoding='utf-8')
+        os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        self.assertEqual(_load_config(str(config_file)), {"paths": ["cc"]})
+
+    def test_output_cache_reused_until_inputs_change(self):
+        """An unchanged tree is served from the cache; an edit reassembles."""
+        from unittest.mock import patch
+        from code_assembler.core import CodebaseAssembler
+
+        src_dir = self.root / "project"
+        src_dir.mkdir()
+        source = src_dir / "main.py"
+        source.write_text("print('v1')", encoding='utf-8')
+        output_file = self.root / "output.md"
+        kwargs = dict(
+            paths=[str(src_dir)], extensions=[".py"], output=str(output_file),
+            cache_dir=str(self.root / "cache"), show_progress=False
+        )
+
+        first = assemble_codebase(**kwargs)
+        output_file.unlink()
+        with patch.object(CodebaseAssembler, "assemble_chunks") as assemble:
+            self.assertEqual(assemble_codebase(**kwargs), first)
+            assemble.assert_not_called()
+        self.assertEqual(output_file.read_text(encoding='utf-8'), first)
+
+        source.write_text("print('v2')", encoding='utf-8')
+        stat = source.stat()
+        os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        self.assertIn("print('v2')", assemble_codebase(**kwargs))
+        self.assertEqual(len(list((self.root / "cache").iterdir())), 1)
+
+    def test_output_cache_keyed_on_working_directory(self):
+        """Metadata paths are relative to the CWD, so another CWD reassembles."""
+        src_dir = self.root / "project"
+        src_dir.mkdir()
+        (src_dir / "main.py").write_text("print('v1')", encoding='utf-8')
+        (self.root / "elsewhere").mkdir()
+        kwargs = dict(
+            paths=[str(src_dir)], extensions=[".py"], output=str(self.root / "output.md"),
+            cache_dir=str(self.root / "cache"), show_progress=False
+        )
+
+        previous_cwd = os.getcwd()
+        try:
+            os.chdir(self.root)
+            assemble_codebase(**kwargs)
+            os.chdir(self.root / "elsewhere")
+            content = assemble_codebase(**kwargs)
+            expected = os.path.relpath(str(src_dir / "main.py"))
+        finally:
+            os.chdir(previous_cwd)
+
+        self.assertIn(json.dumps(expected), content)
+
+    def test_output_cache_shares_the_assembly_walk(self):
+        """The cache key reuses the walk; a miss does not traverse the tree again."""
+        from unittest.mock import patch
+
+        src_dir = self.root / "project"
+        (src_dir / "pkg").mkdir(parents=True)
+        (src_dir / "pkg" / "main.py").write_text("print('v1')", encoding='utf-8')
+        kwargs = dict(
+            paths=[str(src_dir)], extensions=[".py"], output=str(self.root / "output.md"),
+            cache_dir=str(self.root / "cache"), show_progress=False
+        )
+
+        with patch("os.scandir", wraps=os.scandir) as scandir:
+            content = assemble_codebase(**kwargs)
+        self.assertIn("print('v1')", content)
+        # One listing each for project/ and project/pkg/
+        listed = [c.args[0] for c in scandir.call_args_list
+                  if c.args and str(c.args[0]).startswith(str(src_dir))]
+        self.assertEqual(sorted(listed), [str(src_dir), str(src_dir / "pkg")])
+
+        # README files are inputs as well
+        (src_dir / "pkg" / "README.md").write_text("Package notes", encoding='utf-8')
+        self.assertIn("Package notes", assemble_codebase(**kwargs))
+
+    def test_output_cache_keyed_on_loaded_parsers(self):
+        """Compressed output depends on which optional parsers are installed."""
+        from unittest.mock import patch
+        from code_assembler import cache
+        from code_assembler.config import AssemblerConfig
+        from code_assembler.core import CodebaseAssembler
+
+        config = AssemblerConfig(
+            paths=[self.test_dir], extensions=[".py", ".js"], compress=True,
+            output_file=str(self.root / "output.md"), cache_dir=str(self.root / "cache")
+        )
+        with patch("code_assembler.compressor.CodeCompressor._load_parsers"):
+            assembler = CodebaseAssembler(config)
+
+        without_js = cache.cache_key(assembler)
+        assembler.compressor.parsers["javascript"] = object()
+        self.assertNotEqual(cache.cache_key(assembler).split("-")[0], without_js.split("-")[0])
+
+    def test_reads_submitted_at_most_a_window_ahead(self):
+        """Prefetched reads stay bounded however slow the consumer is."""
+        from concurrent.futures import ThreadPoolExecutor
+        from unittest.mock import patch
+        from code_assembler.core import _READ_AHEAD, _read_ahead
+
+        paths = [f"file_{i}.py" for i in range(3 * _READ_AHEAD)]
+        submitted = []
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            submit = executor.submit
+
+            def counting_submit(fn, path):
+                submitted.append(path)
+                return submit(fn, path)
+
+            with patch.object(executor, "submit", counting_submit):
+                results = _read_ahead(executor, str.upper, paths)
+                for consumed, result in enumerate(results, 1):
+                    self.assertEqual(result, paths[consumed - 1].upper())
+                    self.assertLessEqual(len(submitted), consumed + _READ_AHEAD)
+
+        self.assertEqual(submitted, paths)
+
+    def test_one_read_pool_per_assembly(self):
+        """Directories share a single read pool; a lone file is read inline."""
+        from concurrent.futures import ThreadPoolExecutor
+        from unittest.mock import patch
+
+        for name in ("api", "db"):
+            (self.root / name).mkdir()
+            for i in range(3):
+                (self.root / name / f"m{i}.py").write_text(f"X = {i}", encoding='utf-8')
+        single = self.root / "api" / "m0.py"
+
+        with patch("code_assembler.core.ThreadPoolExecutor", wraps=ThreadPoolExecutor) as pool, \
+                patch("code_assembler.core._read_ahead") as read_ahead:
+            read_ahead.side_effect = lambda executor, read, paths: map(read, paths)
+            content = assemble_codebase(
+                paths=[str(self.root / "api"), str(self.root / "db"), str(single)],
+                extensions=[".py"], output=str(self.root / "out.md"), show_progress=False
+            )
+            self.assertEqual(pool.call_count, 1)
+            self.assertEqual(read_ahead.call_count, 2)
+            self.assertIn("X = 2", content)
+
+            read_ahead.reset_mock()
+            assemble_codebase(paths=[str(single)], extensions=[".py"],
+                              output=str(self.root / "out.md"), show_progress=False)
+            read_ahead.assert_not_called()
+
+    def test_readme_probed_only_where_listed(self):
+        """README candidates are only stat'ed in directories that list one."""
+        from unittest.mock import patch
+
+        (self.root / "docs").mkdir()
+        (self.root / "plain").mkdir()
+        (self.root / "docs" / "README.md").write_text("Docs overview", encoding='utf-8')
+        (self.root / "docs" / "a.py").write_text("A = 1", encoding='utf-8')
+        (self.root / "plain" / "b.py").write_text("B = 1", encoding='utf-8')
+
+        with patch("code_assembler.core.os.path.exists", wraps=os.path.exists) as exists:
+            content = assemble_codebase(
+                paths=[str(self.root)], extensions=[".py"],
+                output=str(self.root / "out.md"), show_progress=False
+            )
+
+        self.assertIn("Docs overview", content)
+        probed = {os.path.dirname(call.args[0]) for call in exists.call_args_list}
+        self.assertIn(str(self.root / "docs"), probed)
+        self.assertNotIn(str(self.root / "plain"), probed)
+
+    def test_file_paths_keep_given_order(self):
+        """Files passed directly are emitted in the order of the paths list."""
+        (self.root / "pkg").mkdir()
+        (self.root / "pkg" / "inner.py").write_text("INNER = 1", encoding='utf-8')
+        (self.root / "b.py").write_text("B = 1", encoding='utf-8')
+        (self.root / "a.py").write_text("A = 1", encoding='utf-8')
+        paths = [str(self.root / name) for name in ("b.py", "pkg", "a.py", "b.py")]
+
+        content = assemble_codebase(
+            paths=paths, extensions=[".py"], output=str(self.root / "out.md"), show_progress=False
+        )
+
+        positions = [
+            content.index("B = 1"), content.index("INNER = 1"),
+            content.index("A = 1"), content.rindex("B = 1")
+        ]
+        self.assertEqual(positions, sorted(positions))
+        self.assertEqual(content.count("B = 1"), 2)
+
+    def test_streamed_output_matches_returned_content(self):
+        """A body spilled to disk is written out exactly as it is returned."""
+        from unittest.mock import patch
+
+        src_dir = self.root / "src"
+        src_dir.mkdir()
+        for i in range(20):
+            (src_dir / f"mod_{i}.py").write_text(f"# é {i}\r\nVALUE = {'x' * 500!r}\n", encoding='utf-8')
+        kwargs = dict(paths=[str(src_dir)], extensions=[".py"], show_progress=False)
+
+        returned = assemble_codebase(output=str(self.root / "a.md"), **kwargs)
+        with patch("code_assembler.core._SPOOL_MAX_SIZE", 1024), \
+                patch("code_assembler.core._SPOOL_READ_CHARS", 100):
+            self.assertIsNone(
+                assemble_codebase(output=str(self.root / "b.md"), return_content=False, **kwargs)
+            )
+
+        with open(self.root / "b.md", encoding='utf-8', newline='') as f:
+            streamed = f.read()
+        self.assertIn("VALUE = ", streamed)
+
+        def without_snapshot_time(text):
+            return [line for line in text.split("\n") if not line.startswith("> **Snapshot:**")]
+
+        self.assertEqual(without_snapshot_time(streamed), without_snapshot_time(returned))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -5,11 +5,13 @@ import tempfile
 import time
 import unittest
 from pathlib import Path
+from unittest.mock import patch
 
 # Ajout du src au path
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
 
 from code_assembler.core import assemble_codebase
+from code_assembler.delta import extract_metadata
 
 
 class TestDeltaScenario(unittest.TestCase):
@@ -88,6 +90,54 @@ class TestDeltaScenario(unittest.TestCase):
         # Vérifier le header
         self.assertIn("> ✏️  Modified (1): config.py", content)
 
+    def test_metadata_read_from_end_of_large_snapshot(self):
+        """The trailing block wins over marker text earlier in a large snapshot."""
+        md_file = self.root / "snapshot.md"
+        md_file.write_text(
+            "<!-- CODE_ASSEMBLER_METADATA\n{\"files\": {\"old.py\": \"2020-01-01 00:00\"}}\n-->\n"
+            + "x = 'é'\n" * 50000
+            + "<!-- CODE_ASSEMBLER_METADATA\n{\"files\": {\"api/config.py\": \"2024-05-01 12:30\"}}\n-->",
+            encoding="utf-8"
+        )
+
+        self.assertEqual(list(extract_metadata(str(md_file))), ["api/config.py"])
+
+    def test_delta_reuses_walk_stats(self):
+        """Delta mode reads file sizes from the pre-walk instead of re-statting."""
+        ref_md = self.root / "reference.md"
+        assemble_codebase(
+            paths=[str(self.root)], extensions=[".py"], output=str(ref_md), show_progress=False
+        )
+
+        self.file_b.write_text("DB_CONFIG = 2", encoding="utf-8")
+        future = time.time() + 120
+        os.utime(self.file_b, (future, future))
+
+        with patch("code_assembler.core.os.path.getsize", side_effect=AssertionError("re-stat")):
+            content = assemble_codebase(
+                paths=[str(self.root)], extensions=[".py"], output=str(self.root / "delta.md"),
+                since=str(ref_md), show_progress=False
+            )
+
+        self.assertIn("DB_CONFIG = 2", content)
+        self.assertNotIn("API_CONFIG = 1", content)
+
+    def test_delta_walks_tree_once(self):
+        """The delta pre-walk plan is reused when processing the directory."""
+        ref_md = self.root / "reference.md"
+        assemble_codebase(
+            paths=[str(self.root)], extensions=[".py"], output=str(ref_md), show_progress=False
+        )
+
+        with patch("code_assembler.core.os.scandir", wraps=os.scandir) as scandir:
+            assemble_codebase(
+                paths=[str(self.root)], extensions=[".py"], output=str(self.root / "delta.md"),
+                since=str(ref_md), show_progress=False
+            )
+
+        walked = [call.args[0] for call in scandir.call_args_list]
+        self.assertEqual(len(walked), len(set(walked)))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,12 +1,15 @@
+import os
 import shutil
 import sys
 import tempfile
 import unittest
+from unittest.mock import patch
 from pathlib import Path
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
-from code_assembler.file_io import read_file_head
+from code_assembler import file_io
+from code_assembler.file_io import detect_encoding, read_file_head, load_json_file, dump_json_file, dumps_json
 
 
 class TestFileIO(unittest.TestCase):
@@ -37,6 +40,52 @@ class TestFileIO(unittest.TestCase):
         head = read_file_head(str(self.file_path), max_lines=50)
         self.assertEqual(head, "Single line")
 
+    def test_json_round_trip_both_backends(self):
+        """Configs survive a dump/load cycle with and without orjson."""
+        data = {"paths": ["src"], "output": "café.md", "max_file_size_mb": 2.5}
+        json_path = str(Path(self.test_dir) / "config.json")
+        for backend in (file_io.orjson, None):
+            with self.subTest(orjson=backend is not None), patch.object(file_io, "orjson", backend):
+                dump_json_file(json_path, data)
+                self.assertEqual(load_json_file(json_path), data)
+                self.assertTrue(Path(json_path).read_text(encoding="utf-8").startswith('{\n  "paths"'))
+
+    def test_json_round_trip_lone_surrogate(self):
+        """A path decoded with surrogateescape still saves and loads back."""
+        data = {"paths": [os.fsdecode(b"odd\xff")], "output": "café.md"}
+        json_path = str(Path(self.test_dir) / "config.json")
+        for backend in (file_io.orjson, None):
+            with self.subTest(orjson=backend is not None), patch.object(file_io, "orjson", backend):
+                dump_json_file(json_path, data)
+                self.assertEqual(load_json_file(json_path), data)
+
+    def test_dumps_json_matches_stdlib(self):
+        """Metadata text is identical with and without orjson."""
+        import json
+        samples = [
+            {"files": {"src/main.py": "2024-01-05 03:04"}},
+            {"files": {"src/café.py": "x", "tab\there": "\x7f", "odd\udcff": "y"}},
+            {},
+        ]
+        for backend in (file_io.orjson, None):
+            with patch.object(file_io, "orjson", backend):
+                for data in samples:
+                    with self.subTest(orjson=backend is not None, data=data):
+                        self.assertEqual(dumps_json(data), json.dumps(data, indent=2))
+
+    def test_detect_encoding_without_chardet(self):
+        """UTF-8 samples and byte order marks are recognised without chardet."""
+        cases = [
+            ("a" * 65535 + "é").encode("utf-8"),  # sample ends mid-character
+            "hello wörld".encode("utf-16"),
+            "hello".encode("utf-32"),
+        ]
+        with patch("chardet.detect", side_effect=AssertionError("chardet")):
+            for raw, expected in zip(cases, ("utf-8", "UTF-16", "UTF-32")):
+                with self.subTest(expected=expected):
+                    self.file_path.write_bytes(raw)
+                    self.assertEqual(detect_encoding(str(self.file_path)), expected)
+
 
 if __name__ == '__main__':
     unittest.main()
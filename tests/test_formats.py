@@ -4,10 +4,13 @@ Tests for file format detection and syntax highlighting.
 import sys
 import unittest
 from pathlib import Path
+from unittest.mock import patch
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
 
+from code_assembler.config import AssemblerConfig, CodebaseStats
+from code_assembler.file_io import loads_json
 from code_assembler.formatters import MarkdownFormatter
 
 
@@ -45,5 +48,40 @@ class TestFileFormats(unittest.TestCase):
         self.assertEqual(self.formatter._detect_language("README"), "text")
 
 
+class TestTemplateRendering(unittest.TestCase):
+    def setUp(self):
+        self.formatter = MarkdownFormatter()
+
+    def test_render_matches_plain_jinja(self):
+        """Fully supplied and partially supplied data render as Jinja would."""
+        env = self.formatter.env
+        block = dict(header_level="##", path="src/a.py", lang="python", content="x = 1")
+        self.assertEqual(
+            self.formatter.render("components/file_block.md.j2", block),
+            env.get_template("components/file_block.md.j2").render(**block)
+        )
+        # 'entries' is missing: undefined names render as Jinja leaves them
+        self.assertEqual(
+            self.formatter.render("components/toc.md.j2", {}),
+            env.get_template("components/toc.md.j2").render()
+        )
+
+    def test_bytecode_cache_failures_are_ignored(self):
+        """An unreadable or unwritable template cache falls back to compiling."""
+        from jinja2 import FileSystemBytecodeCache
+        with patch.object(FileSystemBytecodeCache, "load_bytecode", side_effect=OSError), \
+                patch.object(FileSystemBytecodeCache, "dump_bytecode", side_effect=OSError):
+            block = MarkdownFormatter().format_file_block("a.py", "x = 1")
+        self.assertIn("x = 1", block)
+
+    def test_header_and_metadata_share_timestamp(self):
+        """The snapshot line and the metadata block use the same clock reading."""
+        config = AssemblerConfig(paths=["."], extensions=[".py"])
+        header = self.formatter.generate_header(CodebaseStats(), config, "", "")
+        block = self.formatter.generate_metadata_block([])
+        meta = loads_json(block.split("METADATA\n", 1)[1].rsplit("\n-->", 1)[0])
+        self.assertIn(f"**Snapshot:** {meta['generated_at'][:16]} |", header)
+
+
 if __name__ == "__main__":
     unittest.main()
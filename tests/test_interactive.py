@@ -1,7 +1,9 @@
 """
 Tests for interactive wizard mode.
 """
+import os
 import sys
+import tempfile
 import unittest
 from io import StringIO
 from pathlib import Path
@@ -10,7 +12,7 @@ from unittest.mock import patch
 # Add src to path
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
 
-from code_assembler.interactive import InteractiveWizard
+from code_assembler.interactive import InteractiveWizard, _complete_path
 
 
 class TestInteractiveWizard(unittest.TestCase):
@@ -107,6 +109,21 @@ class TestInteractiveWizard(unittest.TestCase):
             output = self.wizard._configure_output()
             self.assertEqual(output, 'my_project.md')  # Should auto-add .md
 
+    def test_configure_output_picks_free_numbered_name(self):
+        """Declining to overwrite falls back to the first unused codebase_N.md."""
+        cwd = os.getcwd()
+        with tempfile.TemporaryDirectory() as tmp:
+            os.chdir(tmp)
+            try:
+                for name in ("codebase.md", "codebase_1.md", "CODEBASE_2.md"):
+                    Path(name).write_text("", encoding='utf-8')
+                with patch('builtins.input', side_effect=['', 'n']):
+                    with patch('sys.stdout', new=StringIO()):
+                        output = self.wizard._configure_output()
+            finally:
+                os.chdir(cwd)
+        self.assertEqual(output, 'codebase_3.md')
+
     def test_configure_advanced_all_defaults(self):
         """Test advanced config with all defaults."""
         with patch('builtins.input', return_value='n'):  # Don't configure advanced
@@ -183,5 +200,43 @@ class TestInteractiveWizard(unittest.TestCase):
         self.assertIn('.tsx', extensions)
 
 
+class TestPathCompletion(unittest.TestCase):
+    """Test TAB completion of paths in the wizard prompts."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = self._tmp.name
+        os.mkdir(os.path.join(self.root, "src"))
+        Path(self.root, "setup.py").write_text("", encoding='utf-8')
+        Path(self.root, "src", "main.py").write_text("", encoding='utf-8')
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _all(self, text):
+        matches, state = [], 0
+        while (match := _complete_path(text, state)) is not None:
+            matches.append(match)
+            state += 1
+        return matches
+
+    def test_completes_files_and_directories(self):
+        """Directories get a trailing slash; completion descends into them."""
+        prefix = os.path.join(self.root, "s")
+        self.assertEqual(self._all(prefix), [
+            os.path.join(self.root, "setup.py"), os.path.join(self.root, "src/")
+        ])
+        self.assertEqual(self._all(os.path.join(self.root, "src/")),
+                         [os.path.join(self.root, "src", "main.py")])
+        self.assertEqual(self._all(os.path.join(self.root, "missing", "x")), [])
+
+    def test_listing_reused_within_ttl(self):
+        """Repeated TAB presses do not rescan the directory."""
+        prefix = os.path.join(self.root, "s")
+        self._all(prefix)
+        Path(self.root, "second.py").write_text("", encoding='utf-8')
+        self.assertNotIn(os.path.join(self.root, "second.py"), self._all(prefix))
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -117,6 +117,46 @@ class TestRebuild(unittest.TestCase):
         self.assertEqual(count, 1)
         self.assertTrue(any("truncated" in err.lower() for err in errors))
 
+    def test_errors_follow_metadata_order(self):
+        """Messages from threaded writes are reported in metadata order."""
+        files = {
+            "b/late.py": "x\n[TRUNCATED]",
+            "a/early.py": "y\n[TRUNCATED]",
+        }
+        meta = {
+            "b/late.py": "2026-02-17 10:00",
+            "missing.py": "2026-02-17 10:00",
+            "a/early.py": "2026-02-17 10:00",
+        }
+        self._create_mock_md(files, meta)
+
+        rebuilder = CodebaseRebuilder(str(self.md_file), str(self.output_dir))
+        count, errors = rebuilder.rebuild()
+
+        self.assertEqual(count, 2)
+        self.assertEqual(errors, [
+            "Warning: b/late.py was truncated in the source MD.",
+            "Content not found for: missing.py",
+            "Warning: a/early.py was truncated in the source MD.",
+        ])
+
+    def test_non_ascii_content_round_trips(self):
+        """Non-ASCII paths and contents are restored byte for byte."""
+        files = {
+            "docs/résumé.md": "Café ☕ — naïve 🚀\n```python\nprint('é')\n```\nFin.",
+            "src/main.py": "print('ok')",
+        }
+        meta = {path: "2026-02-17 10:00" for path in files}
+        self._create_mock_md(files, meta)
+
+        rebuilder = CodebaseRebuilder(str(self.md_file), str(self.output_dir))
+        count, errors = rebuilder.rebuild()
+
+        self.assertEqual(count, 2)
+        self.assertEqual(errors, [])
+        for path, content in files.items():
+            self.assertEqual((self.output_dir / path).read_text(encoding='utf-8'), content)
+
     def test_missing_metadata(self):
         """Test behavior when the Markdown file has no metadata block."""
         self.md_file.write_text("# Just some markdown", encoding='utf-8')
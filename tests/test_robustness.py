@@ -15,9 +15,14 @@ Bugs covered:
     [8] utils       — no timeout on subprocess → potential infinite hang
     [9] core        — write_file_content return value ignored → silent data loss
     [10] interactive — use_default_excludes double-application
+    [11] core        — RecursionError on directory trees deeper than the recursion limit
+    [12] rebuilder   — metadata marker quoted in a file hid the real metadata block
+    [13] rebuilder   — names containing '..' rejected as path traversal
+    [14] rebuilder   — CRLF snapshots rebuilt with stray carriage returns
 """
 
 import argparse
+import inspect
 import json
 import os
 import shutil
@@ -118,7 +123,7 @@ class TestCliShowExcludes(unittest.TestCase):
             exclude_patterns=None, recursive=True, include_readmes=True,
             use_default_excludes=True, max_size=10.0, since=None,
             clip=False, save_config=None, compress=False,
-            compress_level="signatures",
+            compress_level="signatures", cache_dir=None,
         )
         with patch("code_assembler.cli.parse_args", return_value=args):
             with patch("sys.stdout", new=StringIO()):
@@ -143,7 +148,7 @@ class TestCliRebuildErrorDisplay(unittest.TestCase):
             exclude_patterns=None, recursive=True, include_readmes=True,
             use_default_excludes=True, max_size=10.0, since=None,
             clip=False, save_config=None, compress=False,
-            compress_level="signatures",
+            compress_level="signatures", cache_dir=None,
         )
 
         mock_rebuilder = MagicMock()
@@ -170,7 +175,7 @@ class TestCliRebuildErrorDisplay(unittest.TestCase):
             exclude_patterns=None, recursive=True, include_readmes=True,
             use_default_excludes=True, max_size=10.0, since=None,
             clip=False, save_config=None, compress=False,
-            compress_level="signatures",
+            compress_level="signatures", cache_dir=None,
         )
 
         mock_rebuilder = MagicMock()
@@ -305,9 +310,14 @@ class TestDeltaErrorSurfacing(unittest.TestCase):
         from code_assembler.delta import extract_metadata
 
         bad_md = "<!-- CODE_ASSEMBLER_METADATA\n{not valid json}\n-->"
-        with patch("builtins.open", unittest.mock.mock_open(read_data=bad_md)):
+        test_dir = tempfile.mkdtemp()
+        try:
+            md_file = Path(test_dir) / "snapshot.md"
+            md_file.write_text(bad_md, encoding="utf-8")
             with patch("builtins.print") as mock_print:
-                result = extract_metadata("fake.md")
+                result = extract_metadata(str(md_file))
+        finally:
+            shutil.rmtree(test_dir)
 
         self.assertEqual(result, {})
         printed = " ".join(str(c) for c in mock_print.call_args_list)
@@ -319,9 +329,14 @@ class TestDeltaErrorSurfacing(unittest.TestCase):
         from code_assembler.delta import extract_metadata
 
         plain_md = "# Consolidated Codebase\n\nSome content, no metadata block."
-        with patch("builtins.open", unittest.mock.mock_open(read_data=plain_md)):
+        test_dir = tempfile.mkdtemp()
+        try:
+            md_file = Path(test_dir) / "snapshot.md"
+            md_file.write_text(plain_md, encoding="utf-8")
             with patch("builtins.print") as mock_print:
-                result = extract_metadata("fake.md")
+                result = extract_metadata(str(md_file))
+        finally:
+            shutil.rmtree(test_dir)
 
         self.assertEqual(result, {})
         mock_print.assert_not_called()
@@ -559,5 +574,188 @@ class TestInteractiveUseDefaultExcludes(unittest.TestCase):
             )
 
 
+# ---------------------------------------------------------------------------
+# [11] core — deep directory trees must not hit the recursion limit
+# ---------------------------------------------------------------------------
+
+class TestCoreDeepTree(unittest.TestCase):
+
+    def test_walk_deeper_than_recursion_limit(self):
+        """The directory walk must not recurse once per directory level."""
+        from code_assembler.core import assemble_codebase
+
+        test_dir = tempfile.mkdtemp()
+        depth = 200
+        leaf = os.path.join(test_dir, *(["d"] * depth))
+        os.makedirs(leaf)
+        Path(leaf, "deep.py").write_text("DEEP = 1", encoding="utf-8")
+
+        limit = sys.getrecursionlimit()
+        try:
+            # Leave the test's own stack some room, but far fewer frames than levels
+            sys.setrecursionlimit(len(inspect.stack()) + 150)
+            content = assemble_codebase(
+                paths=[test_dir], extensions=[".py"], output=os.path.join(test_dir, "out.md"),
+                show_progress=False, return_content=False
+            )
+        finally:
+            sys.setrecursionlimit(limit)
+            shutil.rmtree(test_dir)
+
+        self.assertIsNone(content)
+
+    def test_cached_walk_deeper_than_recursion_limit(self):
+        """The cache key must not walk the input tree recursively either."""
+        from code_assembler.core import assemble_codebase
+
+        test_dir = tempfile.mkdtemp()
+        depth = 200
+        leaf = os.path.join(test_dir, *(["d"] * depth))
+        os.makedirs(leaf)
+        Path(leaf, "deep.py").write_text("DEEP = 1", encoding="utf-8")
+        kwargs = dict(
+            paths=[os.path.join(test_dir, "d")], extensions=[".py"],
+            output=os.path.join(test_dir, "out.md"),
+            cache_dir=os.path.join(test_dir, "cache"), show_progress=False
+        )
+
+        limit = sys.getrecursionlimit()
+        try:
+            sys.setrecursionlimit(len(inspect.stack()) + 150)
+            first = assemble_codebase(**kwargs)
+            # Served from the cache on the second run
+            second = assemble_codebase(**kwargs)
+        finally:
+            sys.setrecursionlimit(limit)
+            shutil.rmtree(test_dir)
+
+        self.assertIn("DEEP = 1", first)
+        self.assertEqual(second, first)
+
+
+# ---------------------------------------------------------------------------
+# [12] rebuilder — metadata marker quoted inside a file hid the real block
+# ---------------------------------------------------------------------------
+
+class TestRebuildQuotedMetadataMarker(unittest.TestCase):
+
+    def test_rebuild_snapshot_quoting_metadata_marker(self):
+        """
+        A snapshot that includes the formatter writing the metadata block
+        (or any file quoting '<!-- CODE_ASSEMBLER_METADATA') used to be
+        unrebuildable: the first marker in the document was parsed, which
+        was the quoted one, and its payload is not JSON. The block the
+        assembler appends at the end of the snapshot must be the one read.
+        """
+        from code_assembler.rebuilder import CodebaseRebuilder
+
+        test_dir = tempfile.mkdtemp()
+        md_file = os.path.join(test_dir, "snapshot.md")
+        metadata = {"version": "4.5.2", "files": {"src/writer.py": "2026-01-01 10:00"}}
+        Path(md_file).write_text(
+            "### `src/writer.py`\n\n"
+            "```python\n"
+            "BLOCK = '''<!-- CODE_ASSEMBLER_METADATA\n{payload}\n-->'''\n"
+            "```\n"
+            f"\n<!-- CODE_ASSEMBLER_METADATA\n{json.dumps(metadata)}\n-->\n",
+            encoding="utf-8"
+        )
+
+        try:
+            rebuilder = CodebaseRebuilder(md_file, os.path.join(test_dir, "out"))
+            count, errors = rebuilder.rebuild()
+            content = Path(test_dir, "out", "src", "writer.py").read_text(encoding="utf-8")
+        finally:
+            shutil.rmtree(test_dir)
+
+        self.assertEqual(errors, [])
+        self.assertEqual(count, 1)
+        self.assertIn("{payload}", content)
+
+
+# ---------------------------------------------------------------------------
+# [13] rebuilder — names containing '..' rejected as path traversal
+# ---------------------------------------------------------------------------
+
+class TestRebuildDotDotNames(unittest.TestCase):
+
+    def test_rebuild_keeps_names_containing_double_dots(self):
+        """
+        The traversal guard used a substring test, so legitimate names like
+        'release..notes/v1.py' or 'x/setup..py' were skipped with "Security
+        skip" and silently missing from the rebuilt project. Only real '..'
+        segments (either separator style) and absolute paths must be refused.
+        """
+        from code_assembler.rebuilder import CodebaseRebuilder
+
+        test_dir = tempfile.mkdtemp()
+        md_file = os.path.join(test_dir, "snapshot.md")
+        paths = ["release..notes/v1.py", "x/setup..py", "a/../evil.py", "a\\..\\..\\evil.py"]
+        blocks = "".join(f"### `{p}`\n\n```python\nX = 1\n```\n\n" for p in paths)
+        metadata = {"files": {p: "2026-01-01 10:00" for p in paths}}
+        Path(md_file).write_text(
+            blocks + f"<!-- CODE_ASSEMBLER_METADATA\n{json.dumps(metadata)}\n-->\n",
+            encoding="utf-8"
+        )
+
+        try:
+            rebuilder = CodebaseRebuilder(md_file, os.path.join(test_dir, "out"))
+            count, errors = rebuilder.rebuild()
+            rebuilt = sorted(
+                os.path.relpath(os.path.join(root, name), os.path.join(test_dir, "out"))
+                for root, _, names in os.walk(os.path.join(test_dir, "out")) for name in names
+            )
+        finally:
+            shutil.rmtree(test_dir)
+
+        self.assertEqual(count, 2)
+        self.assertEqual(rebuilt, [os.path.join("release..notes", "v1.py"),
+                                   os.path.join("x", "setup..py")])
+        self.assertEqual(errors, [
+            "Security skip (invalid path): a/../evil.py",
+            "Security skip (invalid path): a\\..\\..\\evil.py",
+        ])
+
+
+# ---------------------------------------------------------------------------
+# [14] rebuilder — CRLF snapshots rebuilt with stray carriage returns
+# ---------------------------------------------------------------------------
+
+class TestRebuildCrlfSnapshot(unittest.TestCase):
+
+    def test_rebuild_normalizes_crlf_snapshot(self):
+        """
+        Snapshots written on Windows have CRLF line endings. Once the
+        snapshot was parsed as bytes instead of read as text, the '\r' was
+        kept in every rebuilt file, and on Windows the write's own newline
+        translation then produced '\r\r\n'. Rebuilt files must use the
+        platform's line endings exactly once, as with an LF snapshot.
+        """
+        from code_assembler.rebuilder import CodebaseRebuilder
+
+        test_dir = tempfile.mkdtemp()
+        md_file = os.path.join(test_dir, "snapshot.md")
+        metadata = {"files": {"src/main.py": "2026-01-01 10:00"}}
+        snapshot = (
+            "### `src/main.py`\n\n"
+            "```python\n"
+            "line1\nline2\n"
+            "```\n"
+            f"\n<!-- CODE_ASSEMBLER_METADATA\n{json.dumps(metadata)}\n-->\n"
+        )
+        Path(md_file).write_bytes(snapshot.replace("\n", "\r\n").encode("utf-8"))
+
+        try:
+            rebuilder = CodebaseRebuilder(md_file, os.path.join(test_dir, "out"))
+            count, errors = rebuilder.rebuild()
+            content = Path(test_dir, "out", "src", "main.py").read_bytes()
+        finally:
+            shutil.rmtree(test_dir)
+
+        self.assertEqual(errors, [])
+        self.assertEqual(count, 1)
+        self.assertEqual(content, b"line1" + os.linesep.encode("ascii") + b"line2")
+
+
 if __name__ == "__main__":
     unittest.main()
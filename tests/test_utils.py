@@ -8,7 +8,13 @@ from code_assembler.utils import (
     should_exclude,
     normalize_path,
     format_file_size,
-    slugify_path
+    format_number,
+    count_lines,
+    get_file_extension,
+    slugify_path,
+    compile_exclude_patterns,
+    split_exclude_patterns,
+    is_excluded
 )
 
 
@@ -25,6 +31,10 @@ class TestUtils(unittest.TestCase):
 
         self.assertEqual(normalize_path(""), "")
 
+        # Lexical cleanup only: '.' and repeated slashes go, '..' stays
+        self.assertEqual(normalize_path("./src//pkg/./mod.py"), "src/pkg/mod.py")
+        self.assertEqual(normalize_path("src/../lib/"), "src/../lib")
+
     def test_should_exclude(self):
         """Test the exclusion logic with various patterns."""
         patterns = ["__pycache__", ".git", "venv", "secret.py"]
@@ -53,6 +63,34 @@ class TestUtils(unittest.TestCase):
         # Case 8: Extension pattern
         self.assertTrue(should_exclude("cache/module.pyc", [".pyc"]))
 
+    def test_compiled_excludes_match_segments_only(self):
+        """Compiled patterns keep per-segment semantics: globs never span '/'."""
+        exclude_re = compile_exclude_patterns(["a*b", "build/out", "[!x]y*"])
+
+        self.assertFalse(is_excluded("src/ax/yb.py", exclude_re))
+        self.assertTrue(is_excluded("src/axb/main.py", exclude_re))
+        self.assertTrue(is_excluded("build/out/app.js", exclude_re))
+        self.assertFalse(is_excluded("build/output/app.js", exclude_re))
+        self.assertFalse(is_excluded("x/y", exclude_re))
+        self.assertTrue(is_excluded("src/ay", exclude_re))
+
+    def test_split_excludes(self):
+        """Segment patterns and path patterns compile to separate regexes."""
+        name_re, path_re = split_exclude_patterns(["a*b", ".pyc", "build/out"])
+
+        self.assertTrue(name_re.search("axb"))
+        self.assertTrue(name_re.search("mod.pyc"))
+        self.assertFalse(name_re.search("build"))
+        self.assertTrue(path_re.search("src/build/out/app.js"))
+        self.assertFalse(path_re.search("src/axb"))
+        self.assertIsNone(split_exclude_patterns(["dist"])[1])
+        self.assertIsNone(split_exclude_patterns(["a/b"])[0])
+
+    def test_compiled_excludes_empty(self):
+        """No usable pattern compiles to None, which excludes nothing."""
+        self.assertIsNone(compile_exclude_patterns([""]))
+        self.assertFalse(is_excluded("src/main.py", None))
+
     def test_format_file_size(self):
         """Test human-readable file size formatting."""
         self.assertEqual(format_file_size(0), "0B")
@@ -60,10 +98,30 @@ class TestUtils(unittest.TestCase):
         self.assertEqual(format_file_size(1024), "1.0KB")
         self.assertEqual(format_file_size(1572864), "1.5MB")
 
+    def test_format_number(self):
+        """Thousands separators appear only where needed."""
+        for num, expected in ((0, "0"), (999, "999"), (-999, "-999"), (1000, "1,000"),
+                              (-1000, "-1,000"), (1234567, "1,234,567"), (12.5, "12.5")):
+            self.assertEqual(format_number(num), expected)
+
+    def test_count_lines_matches_splitlines(self):
+        """Line counts agree with str.splitlines on every kind of line break."""
+        for text in ("", "\n", "a", "a\n", "a\nb", "a\n\n", "a\r\nb\r\n",
+                     "a\rb", "a\r", "\r\n\r", "a\x0bb\x0cc", "a\u2028b\x85"):
+            self.assertEqual(count_lines(text), len(text.splitlines()), repr(text))
+
+    def test_get_file_extension_matches_path_suffix(self):
+        """Extensions agree with Path.suffix, dotfiles and trailing dots included."""
+        for path in ("main.py", "src/app.test.js", "archive.tar.gz", ".env",
+                     "config/.gitignore", "Makefile", "file.", "dir.d/file",
+                     "a/..", "notes..txt", "/abs/path/x.md"):
+            self.assertEqual(get_file_extension(path), Path(path).suffix, path)
+
     def test_slugify(self):
         """Test conversion of paths to valid HTML anchors."""
         self.assertEqual(slugify_path("path/to/File.py"), "path_to_file_py")
         self.assertEqual(slugify_path("C:\\My Docs\\script.js"), "c__my_docs_script_js")
+        self.assertEqual(slugify_path("docs/Résumé.md"), "docs_r_sum__md")
 
 
 if __name__ == '__main__':